@@ -29,6 +29,13 @@ def _build_parser() -> argparse.ArgumentParser:
         default=200_000,
         help="Safety limit to prevent infinite runs in cyclic models",
     )
+    sim.add_argument(
+        "--workers",
+        required=False,
+        type=int,
+        default=1,
+        help="Worker processes for v2 models (0 = one per CPU); v1 runs serially",
+    )
     return p
 
 
@@ -37,6 +44,8 @@ def main(argv: list[str] | None = None) -> int:
     args = p.parse_args(argv)
 
     if args.cmd == "simulate":
+        if args.workers < 0:
+            p.error("--workers must be >= 0")
         raw = json.loads(args.model.read_text(encoding="utf-8"))
         model = Model.from_json(raw)
         validate_model(model)
@@ -47,6 +56,7 @@ def main(argv: list[str] | None = None) -> int:
             seed=args.seed,
             max_tasks_per_run=args.max_tasks_per_run,
             want_trace=bool(args.out_trace),
+            workers=args.workers,
         )
 
         summary = aggregate_runs(model=model, runs=runs)
@@ -16,6 +16,7 @@ class RunExecutor(Protocol):
         seed: int,
         max_tasks_per_run: int,
         want_trace: bool,
+        workers: int = 1,
     ) -> tuple[list[RunResult], list[TaskInstance]]:
         raise NotImplementedError
 
@@ -30,7 +31,9 @@ class LegacyNumpyExecutor:
         seed: int,
         max_tasks_per_run: int,
         want_trace: bool,
+        workers: int = 1,
     ) -> tuple[list[RunResult], list[TaskInstance]]:
+        # The frozen v1 oracle always runs serially; ``workers`` is ignored.
         from latencylab.sim_legacy import simulate_many
 
         return simulate_many(
@@ -52,6 +55,7 @@ class StdlibV2Executor:
         seed: int,
         max_tasks_per_run: int,
         want_trace: bool,
+        workers: int = 1,
     ) -> tuple[list[RunResult], list[TaskInstance]]:
         from latencylab.sim_v2 import simulate_many
 
@@ -61,6 +65,7 @@ class StdlibV2Executor:
             seed=seed,
             max_tasks_per_run=max_tasks_per_run,
             want_trace=want_trace,
+            workers=workers,
         )
 
 
@@ -7,6 +7,16 @@ from typing import Any
 
 from latencylab.types import RunResult, TaskInstance
 
+# Rows are formatted directly and written in batches; csv.writer is only used
+# for rows with a text cell that needs quoting. Output is byte-identical to
+# csv.writer's default (excel) dialect.
+_CSV_SPECIAL = frozenset(',"\r\n')
+_ROWS_PER_WRITE = 1024
+
+
+def _needs_quoting(*cells: str) -> bool:
+    return any(not _CSV_SPECIAL.isdisjoint(c) for c in cells)
+
 
 def write_summary_json(path: Path, summary: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -29,19 +39,38 @@ def write_runs_csv(path: Path, runs: list[RunResult]) -> None:
                 "failure_reason",
             ]
         )
+        buf: list[str] = []
         for r in runs:
-            w.writerow(
-                [
-                    r.run_id,
-                    r.first_ui_event_time_ms,
-                    r.last_ui_event_time_ms,
-                    r.makespan_ms,
-                    r.critical_path_ms,
-                    r.critical_path_tasks,
-                    int(r.failed),
-                    r.failure_reason or "",
-                ]
+            reason = r.failure_reason or ""
+            if _needs_quoting(r.critical_path_tasks, reason):
+                f.write("".join(buf))
+                buf.clear()
+                w.writerow(
+                    [
+                        r.run_id,
+                        r.first_ui_event_time_ms,
+                        r.last_ui_event_time_ms,
+                        r.makespan_ms,
+                        r.critical_path_ms,
+                        r.critical_path_tasks,
+                        int(r.failed),
+                        reason,
+                    ]
+                )
+                continue
+            first_ui = r.first_ui_event_time_ms
+            last_ui = r.last_ui_event_time_ms
+            buf.append(
+                f"{r.run_id},"
+                f"{'' if first_ui is None else first_ui},"
+                f"{'' if last_ui is None else last_ui},"
+                f"{r.makespan_ms},{r.critical_path_ms},{r.critical_path_tasks},"
+                f"{int(r.failed)},{reason}\r\n"
             )
+            if len(buf) >= _ROWS_PER_WRITE:
+                f.write("".join(buf))
+                buf.clear()
+        f.write("".join(buf))
 
 
 def write_trace_csv(path: Path, trace: list[TaskInstance]) -> None:
@@ -64,20 +93,40 @@ def write_trace_csv(path: Path, trace: list[TaskInstance]) -> None:
                 "emitted_events",
             ]
         )
+        buf: list[str] = []
         for t in trace:
-            w.writerow(
-                [
-                    t.run_id,
-                    t.instance_id,
-                    t.task_name,
-                    t.context,
-                    t.enqueue_time_ms,
-                    t.start_time_ms,
-                    t.end_time_ms,
-                    t.queue_wait_ms,
-                    t.duration_ms,
-                    t.parent_task_instance_id,
-                    t.capacity_parent_instance_id,
-                    ";".join(t.emitted_events),
-                ]
+            emitted = ";".join(t.emitted_events)
+            if _needs_quoting(t.task_name, t.context, emitted):
+                f.write("".join(buf))
+                buf.clear()
+                w.writerow(
+                    [
+                        t.run_id,
+                        t.instance_id,
+                        t.task_name,
+                        t.context,
+                        t.enqueue_time_ms,
+                        t.start_time_ms,
+                        t.end_time_ms,
+                        t.queue_wait_ms,
+                        t.duration_ms,
+                        t.parent_task_instance_id,
+                        t.capacity_parent_instance_id,
+                        emitted,
+                    ]
+                )
+                continue
+            parent = t.parent_task_instance_id
+            cap_parent = t.capacity_parent_instance_id
+            buf.append(
+                f"{t.run_id},{t.instance_id},{t.task_name},{t.context},"
+                f"{t.enqueue_time_ms},{t.start_time_ms},{t.end_time_ms},"
+                f"{t.queue_wait_ms},{t.duration_ms},"
+                f"{'' if parent is None else parent},"
+                f"{'' if cap_parent is None else cap_parent},"
+                f"{emitted}\r\n"
             )
+            if len(buf) >= _ROWS_PER_WRITE:
+                f.write("".join(buf))
+                buf.clear()
+        f.write("".join(buf))
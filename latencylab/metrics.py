@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import math
 from collections import Counter
 from typing import Any
@@ -30,7 +31,9 @@ def _percentile_sorted(values_sorted: list[float], p: int) -> float:
 def _percentiles(values: list[float], ps: list[int]) -> dict[str, float]:
     if not values:
         return {f"p{p}": math.nan for p in ps}
-    values_sorted = sorted(float(x) for x in values)
+    # Sort once and share it across every requested percentile; map() avoids
+    # a generator frame per value on large run counts.
+    values_sorted = sorted(map(float, values))
     return {f"p{p}": _percentile_sorted(values_sorted, p) for p in ps}
 
 
@@ -45,8 +48,11 @@ def aggregate_runs(*, model: Model, runs: list[RunResult]) -> dict[str, Any]:
     ]
     makespans = [r.makespan_ms for r in ok]
 
-    crit_paths = [r.critical_path_tasks for r in ok if r.critical_path_tasks]
-    counts = {k: int(v) for k, v in Counter(crit_paths).items()}
+    counts = Counter(r.critical_path_tasks for r in ok if r.critical_path_tasks)
+    # Only the top 10 are reported: select them without sorting every distinct
+    # path. (-count, path) tuples compare natively, so no key function is
+    # needed; ties are broken by path.
+    top_paths = heapq.nsmallest(10, [(-c, p) for p, c in counts.items()])
 
     return {
         "model_version": model.version,
@@ -60,8 +66,7 @@ def aggregate_runs(*, model: Model, runs: list[RunResult]) -> dict[str, Any]:
         },
         "critical_path": {
             "top_paths": [
-                {"tasks": path, "count": counts[path]}
-                for path in sorted(counts, key=lambda p: (-counts[p], p))[:10]
+                {"tasks": path, "count": -neg_count} for neg_count, path in top_paths
             ]
         },
     }
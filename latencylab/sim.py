@@ -18,6 +18,7 @@ def simulate_many(
     seed: int,
     max_tasks_per_run: int,
     want_trace: bool,
+    workers: int = 1,
 ) -> tuple[list[RunResult], list[TaskInstance]]:
     executor = default_executor_for_model(model)
     return executor.execute(
@@ -26,4 +27,5 @@ def simulate_many(
         seed=seed,
         max_tasks_per_run=max_tasks_per_run,
         want_trace=want_trace,
+        workers=workers,
     )
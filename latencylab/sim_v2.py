@@ -4,47 +4,34 @@ from __future__ import annotations
 
 from collections import deque
 import heapq
-import math
 import random
 
-from latencylab.model import DurationDist, Model, WiringEdge
-from latencylab.types import EventOccurrence, RunResult, TaskInstance
+from latencylab.model import Model
+from latencylab.sim_v2_parallel import simulate_sharded
+from latencylab.sim_v2_plan import (
+    ModelPlan,
+    Sampler,
+    compile_model,
+    deferred_key_error,
+)
+from latencylab.sim_v2_trace import critical_path_names, materialize_trace
+from latencylab.types import RunResult, TaskInstance
 
 DELAY_CONTEXT = "__delay__"
 
 
-def _sample_ms(rng: random.Random, dist: DurationDist) -> float:
-    name = dist.dist
-    p = dist.params
-    if name == "fixed":
-        return float(p["value"])
-    if name == "normal":
-        mean = float(p["mean"])
-        std = float(p["std"])
-        min_v = float(p.get("min", 0.0))
-        return float(max(min_v, rng.gauss(mu=mean, sigma=std)))
-    if name == "lognormal":
-        mu = float(p["mu"])
-        sigma = float(p["sigma"])
-        return float(math.exp(rng.gauss(mu=mu, sigma=sigma)))
-    raise AssertionError(f"unhandled dist: {name}")
-
-
-def _delay_task_name(event_name: str, task_name: str) -> str:
-    return f"delay({event_name}->{task_name})"
-
-
-def simulate_many(
-    *,
+def _simulate_range(
     model: Model,
-    runs: int,
     seed: int,
+    run_ids: range,
     max_tasks_per_run: int,
     want_trace: bool,
 ) -> tuple[list[RunResult], list[TaskInstance]]:
+    # Module-level so it can be pickled for worker processes.
     all_runs: list[RunResult] = []
     all_traces: list[TaskInstance] = []
-    for run_id in range(runs):
+    plan = compile_model(model)
+    for run_id in run_ids:
         rng = random.Random((seed << 32) ^ run_id)
         res, trace = simulate_one(
             model=model,
@@ -52,6 +39,7 @@ def simulate_many(
             rng=rng,
             max_tasks_per_run=max_tasks_per_run,
             want_trace=want_trace,
+            plan=plan,
         )
         all_runs.append(res)
         if want_trace:
@@ -59,6 +47,28 @@ def simulate_many(
     return all_runs, all_traces
 
 
+def simulate_many(
+    *,
+    model: Model,
+    runs: int,
+    seed: int,
+    max_tasks_per_run: int,
+    want_trace: bool,
+    workers: int = 1,
+) -> tuple[list[RunResult], list[TaskInstance]]:
+    if workers == 1 or runs <= 1:
+        return _simulate_range(model, seed, range(runs), max_tasks_per_run, want_trace)
+    return simulate_sharded(
+        _simulate_range,
+        model=model,
+        runs=runs,
+        seed=seed,
+        max_tasks_per_run=max_tasks_per_run,
+        want_trace=want_trace,
+        workers=workers,
+    )
+
+
 def simulate_one(
     *,
     model: Model,
@@ -66,40 +76,121 @@ def simulate_one(
     rng: random.Random,
     max_tasks_per_run: int,
     want_trace: bool,
+    plan: ModelPlan | None = None,
 ) -> tuple[RunResult, list[TaskInstance]]:
-    ctx_queues: dict[str, deque[tuple[str, float, int | None]]] = {
-        name: deque() for name in model.contexts
-    }
-
-    free_slots: dict[str, list[int]] = {}
-    last_on_slot: dict[str, dict[int, int | None]] = {}
-    for ctx_name, ctx in model.contexts.items():
-        free_slots[ctx_name] = list(range(ctx.concurrency))
-        last_on_slot[ctx_name] = {i: None for i in range(ctx.concurrency)}
-
-    instances: dict[int, TaskInstance] = {}
-    traces: list[TaskInstance] = []
+    if plan is None:
+        plan = compile_model(model)
+
+    ctx_names = plan.ctx_names
+    task_names = plan.task_names
+    task_ctx = plan.task_ctx
+    task_order = plan.task_order
+    task_sampler = plan.task_sampler
+    task_fixed_ms = plan.task_fixed_ms
+    task_emit = plan.task_emit
+    task_emit_names = plan.task_emit_names
+    immediate_by_event = plan.immediate_by_event
+    delays_by_event = plan.delays_by_event
+    event_is_ui = plan.event_is_ui
+
+    # Indexed by context id.
+    ctx_queues: list[deque[tuple[int, float, int | None]]] = [
+        deque() for _ in ctx_names
+    ]
+    # Min-heap of free slot indices: heappop yields the lowest free slot.
+    free_slots: list[list[int]] = [list(range(n)) for n in plan.ctx_concurrency]
+    last_on_slot: list[list[int | None]] = [[None] * n for n in plan.ctx_concurrency]
+    # Context ids that may be able to start a task (queued work, maybe a slot).
+    ready: set[int] = set()
+    ready_add = ready.add
+    # Bound once per run: these are called for every queued task/completion.
+    queue_append = [q.append for q in ctx_queues] + [
+        deferred_key_error(name) for name in plan.unresolved_names
+    ]
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    # Task instances are stored as parallel columns indexed by instance id
+    # (index 0 is unused). TaskInstance objects are only built for traces.
+    # Every instance, delays included, still needs name/ctx/end/cp_prev for
+    # the makespan and critical path; the other columns are only filled in
+    # when a trace was requested.
+    inst_name: list[str] = [""]
+    inst_ctx: list[str] = [""]
+    inst_enqueue: list[float] = [0.0]
+    inst_start: list[float] = [0.0]
+    inst_end: list[float] = [0.0]
+    inst_duration: list[float] = [0.0]
+    inst_emits: list[tuple[str, ...]] = [()]
+    inst_parent: list[int | None] = [None]
+    inst_cap_parent: list[int | None] = [None]
+    # Critical-path predecessor: the capacity parent if it finished after the
+    # instance was enqueued, else the event parent.
+    inst_cp_prev: list[int | None] = [None]
+
+    # Plan task id behind each instance: the task itself for task instances,
+    # the task to enqueue on completion for delay instances.
+    inst_task: list[int] = [-1]
     next_instance_id = 1
-    next_event_id = 1
 
-    event_occurrences: list[EventOccurrence] = []
+    # Simulation time never goes backwards, so the first and last UI event
+    # times are simply the first and latest ones seen.
+    first_ui: float | None = None
+    last_ui: float | None = None
 
-    # (time, kind, ctx, name, instance_id, slot)
-    # kind: 0=delay_end, 1=task_end
-    completion_heap: list[tuple[float, int, str, str, int, int | None]] = []
-    delay_targets: dict[int, tuple[str, float]] = {}
+    # (time, order key, instance_id, slot). The plan's order key packs the
+    # (delay-before-task, ctx name, name) tie-break into one int; slot is None
+    # for delays.
+    completion_heap: list[tuple[float, int, int, int | None]] = []
+    # Completions at exactly the current time t (zero-length tasks and delays)
+    # skip the heap: the heap holds nothing at t once a batch is drained, so
+    # they simply form the next batch at t.
+    now_bucket: list[tuple[float, int, int, int | None]] = []
 
     tasks_created = 0
     failed = False
     failure_reason: str | None = None
 
-    def _record_instance(inst: TaskInstance) -> None:
-        instances[inst.instance_id] = inst
+    # Critical-path seed: the instance with the largest (end, ctx, name, id),
+    # tracked as instances are recorded. Ids only grow, so on an equal
+    # (end, ctx, name) the newer instance wins. Id 0 is the "" placeholder.
+    last_id = 0
+    max_end = 0.0
+
+    def _record_instance(
+        instance_id: int,
+        name: str,
+        ctx: str,
+        enqueue_time_ms: float,
+        start_time_ms: float,
+        end_time_ms: float,
+        duration_ms: float,
+        emits: tuple[str, ...],
+        parent: int | None,
+        cap_parent: int | None,
+        cp_prev: int | None,
+    ) -> None:
+        nonlocal last_id, max_end
+        if end_time_ms >= max_end and (
+            end_time_ms > max_end
+            or (ctx, name) >= (inst_ctx[last_id], inst_name[last_id])
+        ):
+            last_id = instance_id
+            max_end = end_time_ms
+        inst_name.append(name)
+        inst_ctx.append(ctx)
+        inst_end.append(end_time_ms)
+        inst_cp_prev.append(cp_prev)
         if want_trace:
-            traces.append(inst)
+            inst_enqueue.append(enqueue_time_ms)
+            inst_start.append(start_time_ms)
+            inst_duration.append(duration_ms)
+            inst_emits.append(emits)
+            inst_parent.append(parent)
+            inst_cap_parent.append(cap_parent)
 
     def enqueue_task(
-        task_name: str, enqueue_time_ms: float, parent_task: int | None
+        task_id: int, enqueue_time_ms: float, parent_task: int | None
     ) -> None:
         nonlocal tasks_created, failed, failure_reason
         if tasks_created >= max_tasks_per_run:
@@ -107,217 +198,189 @@ def simulate_one(
             failure_reason = f"max_tasks_per_run exceeded ({max_tasks_per_run})"
             return
         tasks_created += 1
-        task_def = model.tasks[task_name]
-        ctx_queues[task_def.context].append(
-            (task_name, float(enqueue_time_ms), parent_task)
-        )
+        ctx_id = task_ctx[task_id]
+        queue_append[ctx_id]((task_id, enqueue_time_ms, parent_task))
+        ready_add(ctx_id)
 
     def schedule_delay(
-        *,
-        event_name: str,
-        edge: WiringEdge,
+        target_task: int,
+        delay_sample: Sampler,
+        delay_name: str,
+        delay_order: int,
         emit_time_ms: float,
         source_task: int | None,
     ) -> None:
         nonlocal next_instance_id
-        assert edge.delay_ms is not None
-        delay_ms = _sample_ms(rng, edge.delay_ms)
-        delay_ms = max(0.0, float(delay_ms))
-        start = float(emit_time_ms)
+        # Samplers return floats and times are sums of floats (from t=0.0),
+        # so nothing on the hot path needs a float() coercion.
+        delay_ms = max(0.0, delay_sample(rng))
+        start = emit_time_ms
         end = start + delay_ms
 
-        inst = TaskInstance(
-            instance_id=next_instance_id,
-            run_id=run_id,
-            task_name=_delay_task_name(event_name, edge.task),
-            context=DELAY_CONTEXT,
-            enqueue_time_ms=start,
-            start_time_ms=start,
-            end_time_ms=end,
-            queue_wait_ms=0.0,
-            duration_ms=delay_ms,
-            emitted_events=(),
-            parent_task_instance_id=source_task,
-            capacity_parent_instance_id=None,
+        instance_id = next_instance_id
+        _record_instance(
+            instance_id,
+            delay_name,
+            DELAY_CONTEXT,
+            start,
+            start,
+            end,
+            delay_ms,
+            (),
+            source_task,
+            None,
+            source_task,
         )
-        delay_targets[inst.instance_id] = (edge.task, start)
-        _record_instance(inst)
+        inst_task.append(target_task)
 
-        heapq.heappush(
-            completion_heap,
-            (inst.end_time_ms, 0, inst.context, inst.task_name, inst.instance_id, None),
-        )
+        if end == start:
+            now_bucket.append((end, delay_order, instance_id, None))
+        else:
+            heappush(completion_heap, (end, delay_order, instance_id, None))
         next_instance_id += 1
 
     def occur_event(
-        name: str, time_ms: float, source_task_instance_id: int | None
+        event_id: int, time_ms: float, source_task_instance_id: int | None
     ) -> None:
-        nonlocal next_event_id
-        eo = EventOccurrence(
-            event_id=next_event_id,
-            name=name,
-            time_ms=float(time_ms),
-            source_task_instance_id=source_task_instance_id,
-        )
-        next_event_id += 1
-        event_occurrences.append(eo)
-
-        edges = model.wiring_edges.get(name, ())
-        for edge in edges:
-            if edge.delay_ms is None:
-                enqueue_task(
-                    task_name=edge.task,
-                    enqueue_time_ms=float(time_ms),
-                    parent_task=source_task_instance_id,
-                )
-            else:
-                schedule_delay(
-                    event_name=name,
-                    edge=edge,
-                    emit_time_ms=float(time_ms),
-                    source_task=source_task_instance_id,
-                )
+        nonlocal first_ui, last_ui
+        if event_is_ui[event_id]:
+            if first_ui is None:
+                first_ui = time_ms
+            last_ui = time_ms
+
+        # Immediate listeners only enqueue (no RNG draws, no instance ids), so
+        # handling them before the delays leaves every queue, id and sample
+        # as in wiring order.
+        for target_task in immediate_by_event[event_id]:
+            enqueue_task(target_task, time_ms, source_task_instance_id)
+        for target_task, delay_sample, delay_name, delay_order in delays_by_event[
+            event_id
+        ]:
+            schedule_delay(
+                target_task,
+                delay_sample,
+                delay_name,
+                delay_order,
+                time_ms,
+                source_task_instance_id,
+            )
 
     def try_start_tasks(now_ms: float) -> None:
         nonlocal next_instance_id
-        made_progress = True
-        while made_progress and not failed:
-            made_progress = False
-            for ctx_name, q in ctx_queues.items():
-                if not q or not free_slots[ctx_name]:
+        # Start at most one task per ready context per round, scanning contexts
+        # in model order, until no context can start anything.
+        while ready and not failed:
+            for ctx_id in sorted(ready):
+                q = ctx_queues[ctx_id]
+                if not q or not free_slots[ctx_id]:
+                    ready.discard(ctx_id)
                     continue
-                task_name, enqueue_time_ms, parent_task = q.popleft()
+                task_id, enqueue_time_ms, parent_task = q.popleft()
 
-                free_slots[ctx_name].sort()
-                slot = free_slots[ctx_name].pop(0)
-                cap_parent = last_on_slot[ctx_name][slot]
+                slot = heappop(free_slots[ctx_id])
+                cap_parent = last_on_slot[ctx_id][slot]
 
-                start_time_ms = float(now_ms)
-                duration = _sample_ms(rng, model.tasks[task_name].duration_ms)
-                duration = max(0.0, float(duration))
+                start_time_ms = now_ms
+                duration = task_fixed_ms[task_id]
+                if duration is None:
+                    duration = max(0.0, task_sampler[task_id](rng))
                 end_time_ms = start_time_ms + duration
 
-                inst = TaskInstance(
-                    instance_id=next_instance_id,
-                    run_id=run_id,
-                    task_name=task_name,
-                    context=ctx_name,
-                    enqueue_time_ms=float(enqueue_time_ms),
-                    start_time_ms=start_time_ms,
-                    end_time_ms=end_time_ms,
-                    queue_wait_ms=float(start_time_ms - enqueue_time_ms),
-                    duration_ms=duration,
-                    emitted_events=tuple(model.tasks[task_name].emit),
-                    parent_task_instance_id=parent_task,
-                    capacity_parent_instance_id=cap_parent,
-                )
-                _record_instance(inst)
-                next_instance_id += 1
-
-                heapq.heappush(
-                    completion_heap,
+                instance_id = next_instance_id
+                task_name = task_names[task_id]
+                ctx_name = ctx_names[ctx_id]
+                _record_instance(
+                    instance_id,
+                    task_name,
+                    ctx_name,
+                    enqueue_time_ms,
+                    start_time_ms,
+                    end_time_ms,
+                    duration,
+                    task_emit_names[task_id],
+                    parent_task,
+                    cap_parent,
                     (
-                        inst.end_time_ms,
-                        1,
-                        inst.context,
-                        inst.task_name,
-                        inst.instance_id,
-                        slot,
+                        cap_parent
+                        if cap_parent is not None
+                        and inst_end[cap_parent] > enqueue_time_ms
+                        else parent_task
                     ),
                 )
-                last_on_slot[ctx_name][slot] = inst.instance_id
-                made_progress = True
+                inst_task.append(task_id)
+                next_instance_id += 1
+
+                entry = (end_time_ms, task_order[task_id], instance_id, slot)
+                if end_time_ms == start_time_ms:
+                    now_bucket.append(entry)
+                else:
+                    heappush(completion_heap, entry)
+                last_on_slot[ctx_id][slot] = instance_id
 
     t = 0.0
-    occur_event(model.entry_event, time_ms=0.0, source_task_instance_id=None)
+    occur_event(plan.entry_event_id, time_ms=0.0, source_task_instance_id=None)
     try_start_tasks(t)
 
-    while completion_heap and not failed:
-        t_next = completion_heap[0][0]
-        t = t_next
-
-        completed: list[tuple[float, int, str, str, int, int | None]] = []
-        while completion_heap and completion_heap[0][0] == t_next:
-            completed.append(heapq.heappop(completion_heap))
-
-        # Deterministic order for same-time completions.
-        completed.sort(key=lambda x: (x[1], x[2], x[3], x[4]))
-
-        for _, kind, ctx_name, _name, instance_id, slot in completed:
-            inst = instances[instance_id]
-            if kind == 1:
-                assert slot is not None
-                free_slots[ctx_name].append(int(slot))
-                for ev in inst.emitted_events:
-                    occur_event(
-                        ev,
-                        time_ms=inst.end_time_ms,
-                        source_task_instance_id=instance_id,
-                    )
+    # Same-time completions are processed in (order key, instance id) order;
+    # instance ids are unique, so the slot is never compared.
+    while (now_bucket or completion_heap) and not failed:
+        completed: list[tuple[float, int, int, int | None]]
+        if now_bucket:
+            # Appended in creation order, so this batch needs sorting.
+            completed = now_bucket.copy()
+            now_bucket.clear()
+            if len(completed) > 1:
+                completed.sort()
+        else:
+            # The heap key already encodes the tie-break: pops come out sorted.
+            t = completion_heap[0][0]
+            completed = []
+            while completion_heap and completion_heap[0][0] == t:
+                completed.append(heappop(completion_heap))
+
+        for end_time_ms, _order, instance_id, slot in completed:
+            if slot is not None:
+                task_id = inst_task[instance_id]
+                ctx_id = task_ctx[task_id]
+                heappush(free_slots[ctx_id], slot)
+                if ctx_queues[ctx_id]:
+                    ready_add(ctx_id)
+                for ev in task_emit[task_id]:
+                    occur_event(ev, end_time_ms, instance_id)
             else:
-                target_task, _emit_time = delay_targets[instance_id]
-                enqueue_task(
-                    task_name=target_task,
-                    enqueue_time_ms=inst.end_time_ms,
-                    parent_task=instance_id,
-                )
+                enqueue_task(inst_task[instance_id], end_time_ms, instance_id)
 
         try_start_tasks(t)
 
-    makespan = 0.0
-    if instances:
-        makespan = max(i.end_time_ms for i in instances.values())
-
-    ui_times: list[float] = []
-    for eo in event_occurrences:
-        ev_def = model.events.get(eo.name)
-        if ev_def and ev_def.has_tag("ui"):
-            ui_times.append(eo.time_ms)
-    first_ui = min(ui_times) if ui_times else None
-    last_ui = max(ui_times) if ui_times else None
+    makespan = max_end
 
     critical_tasks: list[str] = []
     critical_ms = makespan
-    if instances:
-        last_inst = max(
-            instances.values(),
-            key=lambda i: (i.end_time_ms, i.context, i.task_name, i.instance_id),
-        )
-        cur: TaskInstance | None = last_inst
-        while cur is not None:
-            critical_tasks.append(cur.task_name)
-
-            cap_pred = (
-                instances[cur.capacity_parent_instance_id]
-                if cur.capacity_parent_instance_id is not None
-                else None
-            )
-            cap_time = cap_pred.end_time_ms if cap_pred is not None else float("-inf")
-
-            evt_pred = (
-                instances[cur.parent_task_instance_id]
-                if cur.parent_task_instance_id is not None
-                else None
-            )
-            evt_time = cur.enqueue_time_ms
-
-            if cap_time > evt_time:
-                cur = cap_pred
-            elif evt_pred is not None and evt_time >= cap_time:
-                cur = evt_pred
-            else:
-                cur = None
-
-        critical_tasks.reverse()
+    if last_id:
+        critical_tasks = critical_path_names(last_id, inst_name, inst_cp_prev)
 
     run = RunResult(
         run_id=run_id,
         first_ui_event_time_ms=first_ui,
         last_ui_event_time_ms=last_ui,
-        makespan_ms=float(makespan),
-        critical_path_ms=float(critical_ms),
+        makespan_ms=makespan,
+        critical_path_ms=critical_ms,
         critical_path_tasks=">".join(critical_tasks),
         failed=failed,
         failure_reason=failure_reason,
     )
+    traces: list[TaskInstance] = []
+    if want_trace:
+        traces = materialize_trace(
+            run_id,
+            inst_name,
+            inst_ctx,
+            inst_enqueue,
+            inst_start,
+            inst_end,
+            inst_duration,
+            inst_emits,
+            inst_parent,
+            inst_cap_parent,
+        )
     return run, traces
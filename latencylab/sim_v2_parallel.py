@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+# Process-pool fan-out for the v2 engine.
+#
+# Runs are independent: each seeds its own RNG from (seed, run_id). They can
+# therefore be split into contiguous shards, simulated in worker processes and
+# concatenated in run order, giving results identical to a serial call.
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+from typing import Callable
+
+from latencylab.model import Model
+from latencylab.types import RunResult, TaskInstance
+
+# (model, seed, run_ids, max_tasks_per_run, want_trace) -> (runs, traces).
+# Must be a module-level function so it can be pickled.
+ShardFn = Callable[
+    [Model, int, range, int, bool], tuple[list[RunResult], list[TaskInstance]]
+]
+
+# A few shards per worker keeps the pool busy when run lengths vary.
+_SHARDS_PER_WORKER = 4
+
+# Per-process arguments shared by every shard, set once by the pool
+# initializer so the model is pickled once per worker rather than per shard.
+_worker_args: tuple[ShardFn, Model, int, int, bool] | None = None
+
+
+def _init_worker(
+    shard_fn: ShardFn,
+    model: Model,
+    seed: int,
+    max_tasks_per_run: int,
+    want_trace: bool,
+) -> None:
+    global _worker_args
+    _worker_args = (shard_fn, model, seed, max_tasks_per_run, want_trace)
+
+
+def _run_shard(run_ids: range) -> tuple[list[RunResult], list[TaskInstance]]:
+    assert _worker_args is not None
+    shard_fn, model, seed, max_tasks_per_run, want_trace = _worker_args
+    return shard_fn(model, seed, run_ids, max_tasks_per_run, want_trace)
+
+
+def shard_ranges(runs: int, n_shards: int) -> list[range]:
+    bounds = [runs * i // n_shards for i in range(n_shards + 1)]
+    return [range(lo, hi) for lo, hi in zip(bounds, bounds[1:])]
+
+
+def simulate_sharded(
+    shard_fn: ShardFn,
+    *,
+    model: Model,
+    runs: int,
+    seed: int,
+    max_tasks_per_run: int,
+    want_trace: bool,
+    workers: int,
+) -> tuple[list[RunResult], list[TaskInstance]]:
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    n_shards = min(runs, workers * _SHARDS_PER_WORKER)
+
+    all_runs: list[RunResult] = []
+    all_traces: list[TaskInstance] = []
+    with ProcessPoolExecutor(
+        max_workers=min(workers, n_shards),
+        initializer=_init_worker,
+        initargs=(shard_fn, model, seed, max_tasks_per_run, want_trace),
+    ) as ex:
+        # map() yields in submission order, so runs stay in run_id order.
+        for shard_runs, shard_traces in ex.map(
+            _run_shard, shard_ranges(runs, n_shards)
+        ):
+            all_runs.extend(shard_runs)
+            all_traces.extend(shard_traces)
+    return all_runs, all_traces
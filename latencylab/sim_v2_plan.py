@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+# Integer-indexed view of a Model for the v2 engine.
+#
+# Built once per simulate_many() call so the per-run event loop indexes tuples
+# by small ints instead of hashing task/context/event names on every step, and
+# samples durations through pre-parsed closures.
+
+from dataclasses import dataclass
+import math
+import random
+from typing import Callable, NoReturn
+
+from latencylab.model import DurationDist, Model
+
+# A duration distribution with its parameters already pulled out of the
+# params dict: ("fixed", value, 0, 0), ("normal", mean, std, min) or
+# ("lognormal", mu, sigma, 0). Unknown dists keep their name and are reported
+# when sampled, as before.
+DistSpec = tuple[str, float, float, float]
+
+# Draws one sample for a fixed DistSpec from the run's RNG.
+Sampler = Callable[[random.Random], float]
+
+# (target task id, delay sampler, synthetic delay task name, completion order
+#  key of the delay)
+DelayEdge = tuple[int, Sampler, str, int]
+
+
+def _delay_task_name(event_name: str, task_name: str) -> str:
+    return f"delay({event_name}->{task_name})"
+
+
+def dist_spec(dist: DurationDist) -> DistSpec:
+    name = dist.dist
+    p = dist.params
+    if name == "fixed":
+        return (name, float(p["value"]), 0.0, 0.0)
+    if name == "normal":
+        return (name, float(p["mean"]), float(p["std"]), float(p.get("min", 0.0)))
+    if name == "lognormal":
+        return (name, float(p["mu"]), float(p["sigma"]), 0.0)
+    return (name, 0.0, 0.0, 0.0)
+
+
+def compile_sampler(spec: DistSpec) -> Sampler:
+    # Parameters are bound as closure constants: no dispatch or unpacking per
+    # draw. The RNG calls are exactly those of the unparsed path.
+    name, a, b, c = spec
+    if name == "fixed":
+        return lambda rng: a
+    if name == "normal":
+        return lambda rng: max(c, rng.gauss(a, b))
+    if name == "lognormal":
+        return lambda rng: math.exp(rng.gauss(a, b))
+
+    def _unhandled(rng: random.Random) -> float:
+        raise AssertionError(f"unhandled dist: {name}")
+
+    return _unhandled
+
+
+def deferred_key_error(key: str) -> Callable[..., NoReturn]:
+    # Stands in for a lookup that failed at compile time, so an unvalidated
+    # model only fails if (and when) a run actually reaches it.
+    def _raise(*_args: object) -> NoReturn:
+        raise KeyError(key)
+
+    return _raise
+
+
+def _compile_dist(dist: DurationDist) -> tuple[DistSpec, Sampler]:
+    try:
+        spec = dist_spec(dist)
+    except KeyError as e:
+        # A missing parameter only raised when sampled; keep it that way.
+        return (f"missing:{dist.dist}", 0.0, 0.0, 0.0), deferred_key_error(e.args[0])
+    return spec, compile_sampler(spec)
+
+
+def _name_ranks(names: list[str]) -> dict[str, int]:
+    # Equal names share a rank, so ranks compare exactly like the names do.
+    return {name: i for i, name in enumerate(sorted(set(names)))}
+
+
+@dataclass(frozen=True)
+class ModelPlan:
+    # Contexts, in model order (this is also the scheduling scan order).
+    ctx_names: tuple[str, ...]
+    ctx_concurrency: tuple[int, ...]
+    # Names behind the ctx ids past the last real context: tasks that only
+    # unvalidated wiring refers to, or contexts only such tasks use. Enqueuing
+    # onto one raises KeyError(name), as the name lookup did.
+    unresolved_names: tuple[str, ...]
+
+    # Events.
+    event_names: tuple[str, ...]
+    event_is_ui: tuple[bool, ...]
+    entry_event_id: int
+    # Listeners of event e, split by kind (empty tuples if unwired): target
+    # task ids enqueued immediately, and delay edges. Each keeps wiring order.
+    immediate_by_event: tuple[tuple[int, ...], ...]
+    delays_by_event: tuple[tuple[DelayEdge, ...], ...]
+
+    # Tasks.
+    task_names: tuple[str, ...]
+    task_ctx: tuple[int, ...]
+    # Same-time completions are processed delays first, then by context name,
+    # then by task (or delay) name. That order is packed into one small int
+    # per task here and per delay edge in delays_by_event.
+    task_order: tuple[int, ...]
+    task_duration: tuple[DistSpec, ...]
+    task_sampler: tuple[Sampler, ...]
+    # Clamped duration of tasks with a fixed dist (no sampler call), else None.
+    task_fixed_ms: tuple[float | None, ...]
+    task_emit: tuple[tuple[int, ...], ...]
+    task_emit_names: tuple[tuple[str, ...], ...]
+
+
+def compile_model(model: Model) -> ModelPlan:
+    ctx_names = tuple(model.contexts)
+    ctx_ids = {name: i for i, name in enumerate(ctx_names)}
+
+    # Unvalidated models may reference events that are not declared; give them
+    # ids too (they are simply untagged).
+    event_ids: dict[str, int] = {}
+    for name in model.events:
+        event_ids.setdefault(name, len(event_ids))
+    event_ids.setdefault(model.entry_event, len(event_ids))
+    for name in model.wiring_edges:
+        event_ids.setdefault(name, len(event_ids))
+    for task in model.tasks.values():
+        for name in task.emit:
+            event_ids.setdefault(name, len(event_ids))
+    event_names = tuple(event_ids)
+
+    tasks = list(model.tasks.values())
+    task_ids = {name: i for i, name in enumerate(model.tasks)}
+    # Unvalidated models may also wire tasks that are not declared, or put
+    # tasks on undeclared contexts. They get ids on a context id of their own
+    # whose queue raises the KeyError the engine used to hit on enqueue.
+    unresolved: dict[str, int] = {}
+    task_ctx_ids: list[int] = []
+    for t in tasks:
+        ctx_id = ctx_ids.get(t.context)
+        if ctx_id is None:
+            ctx_id = unresolved.setdefault(t.context, len(ctx_names) + len(unresolved))
+        task_ctx_ids.append(ctx_id)
+    missing_tasks: list[str] = []
+    for edges in model.wiring_edges.values():
+        for edge in edges:
+            if edge.task not in task_ids:
+                task_ids[edge.task] = len(task_ids)
+                missing_tasks.append(edge.task)
+                task_ctx_ids.append(
+                    unresolved.setdefault(edge.task, len(ctx_names) + len(unresolved))
+                )
+    task_names = tuple(task_ids)
+
+    delay_rank = _name_ranks(
+        [
+            _delay_task_name(ev_name, edge.task)
+            for ev_name, edges in model.wiring_edges.items()
+            for edge in edges
+            if edge.delay_ms is not None
+        ]
+    )
+    immediate_by_event: list[tuple[int, ...]] = [() for _ in event_names]
+    delays_by_event: list[tuple[DelayEdge, ...]] = [() for _ in event_names]
+    for ev_name, edges in model.wiring_edges.items():
+        immediate: list[int] = []
+        delays: list[DelayEdge] = []
+        for edge in edges:
+            if edge.delay_ms is None:
+                immediate.append(task_ids[edge.task])
+            else:
+                name = _delay_task_name(ev_name, edge.task)
+                delays.append(
+                    (
+                        task_ids[edge.task],
+                        _compile_dist(edge.delay_ms)[1],
+                        name,
+                        delay_rank[name],
+                    )
+                )
+        immediate_by_event[event_ids[ev_name]] = tuple(immediate)
+        delays_by_event[event_ids[ev_name]] = tuple(delays)
+
+    # Delay keys are 0..len(delay_rank)-1; task keys follow, ordered by
+    # (context name rank, task name rank). Unresolved tasks never start, so
+    # their key is never used.
+    ctx_rank = _name_ranks(list(ctx_names))
+    task_rank = _name_ranks(list(model.tasks))
+    task_order = tuple(
+        len(delay_rank) + ctx_rank.get(t.context, 0) * len(task_rank) + task_rank[name]
+        for name, t in zip(model.tasks, tasks)
+    ) + (0,) * len(missing_tasks)
+
+    def _is_ui(name: str) -> bool:
+        ev_def = model.events.get(name)
+        return bool(ev_def and ev_def.has_tag("ui"))
+
+    compiled = [_compile_dist(t.duration_ms) for t in tasks]
+    # Undeclared tasks are never started, so they never sample.
+    compiled += [_compile_dist(DurationDist("missing", {}))] * len(missing_tasks)
+    task_duration = tuple(spec for spec, _ in compiled)
+
+    return ModelPlan(
+        ctx_names=ctx_names,
+        ctx_concurrency=tuple(model.contexts[n].concurrency for n in ctx_names),
+        unresolved_names=tuple(unresolved),
+        event_names=event_names,
+        event_is_ui=tuple(_is_ui(n) for n in event_names),
+        entry_event_id=event_ids[model.entry_event],
+        immediate_by_event=tuple(immediate_by_event),
+        delays_by_event=tuple(delays_by_event),
+        task_names=task_names,
+        task_ctx=tuple(task_ctx_ids),
+        task_order=task_order,
+        task_duration=task_duration,
+        task_sampler=tuple(sampler for _, sampler in compiled),
+        task_fixed_ms=tuple(
+            max(0.0, spec[1]) if spec[0] == "fixed" else None for spec in task_duration
+        ),
+        task_emit=tuple(tuple(event_ids[ev] for ev in t.emit) for t in tasks)
+        + ((),) * len(missing_tasks),
+        task_emit_names=tuple(t.emit for t in tasks) + ((),) * len(missing_tasks),
+    )
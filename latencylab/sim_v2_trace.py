@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+# Trace materialization and critical-path extraction for the v2 engine.
+#
+# simulate_one() records task instances as parallel columns indexed by
+# instance id (index 0 is an unused placeholder). TaskInstance objects are
+# only needed at the API boundary, so they are built here, once per run, and
+# only when a trace was requested.
+
+from itertools import repeat
+from operator import sub
+
+from latencylab.types import TaskInstance
+
+
+def materialize_trace(
+    run_id: int,
+    name: list[str],
+    ctx: list[str],
+    enqueue: list[float],
+    start: list[float],
+    end: list[float],
+    duration: list[float],
+    emits: list[tuple[str, ...]],
+    parent: list[int | None],
+    cap_parent: list[int | None],
+) -> list[TaskInstance]:
+    starts = start[1:]
+    enqueues = enqueue[1:]
+    # Positional construction straight from the columns: no per-row kwargs
+    # parsing and no intermediate row tuples.
+    return list(
+        map(
+            TaskInstance,
+            range(1, len(name)),
+            repeat(run_id),
+            name[1:],
+            ctx[1:],
+            enqueues,
+            starts,
+            end[1:],
+            map(sub, starts, enqueues),
+            duration[1:],
+            emits[1:],
+            parent[1:],
+            cap_parent[1:],
+        )
+    )
+
+
+def critical_path_names(
+    last_id: int, name: list[str], cp_prev: list[int | None]
+) -> list[str]:
+    # Walk back from the last-finishing instance. cp_prev[i] is whichever of
+    # i's capacity (slot) or event predecessors gated its start; simulate_one()
+    # picks it when i is recorded.
+    names: list[str] = []
+    cur: int | None = last_id
+    while cur is not None:
+        names.append(name[cur])
+        cur = cp_prev[cur]
+
+    names.reverse()
+    return names
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskInstance:
     instance_id: int
     run_id: int
@@ -19,7 +19,7 @@ class TaskInstance:
     capacity_parent_instance_id: int | None  # slot causality
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunResult:
     run_id: int
     first_ui_event_time_ms: float | None
@@ -31,7 +31,7 @@ class RunResult:
     failure_reason: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventOccurrence:
     event_id: int
     name: str
@@ -9,7 +9,7 @@ on tooltips for full path traceability.
 
 from dataclasses import dataclass
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QRect, Qt
 from PySide6.QtGui import QColor, QPainter
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -23,7 +23,7 @@ from PySide6.QtWidgets import (
 from latencylab_ui.distributions_agg import CriticalPathBar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _RowModel:
     label_text: str
     tooltip_text: str
@@ -55,36 +55,26 @@ class CriticalPathFrequencyWidget(QWidget):
         self._content_layout.setSpacing(4)
         self._scroll.setWidget(self._content)
 
+        # Persistent layout: [empty placeholder, rows..., stretch]. Renders
+        # reuse rows in place; only a change in row count adds/removes widgets.
+        self._empty = QLabel("No critical-path data", self._content)
+        self._empty.setObjectName("critical_path_empty")
+        self._empty.hide()
+        self._content_layout.addWidget(self._empty)
+        self._content_layout.addStretch(1)
+
         root_layout.addWidget(self._scroll, 1)
 
         # Exposed for tests (stable ordering).
         self._rows: list[_FrequencyRow] = []
 
     def set_data(self, bars: list[CriticalPathBar]) -> None:
-        # Clear previous rows deterministically.
-        for row in self._rows:
-            row.setParent(None)
-            row.deleteLater()
-        self._rows = []
-
-        # Remove any leftover layout items.
-        while self._content_layout.count():
-            item = self._content_layout.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.setParent(None)
-                w.deleteLater()
-            else:
-                # Layout-only items (eg stretches/spacers) need no explicit cleanup.
-                continue
-
         if not bars:
-            empty = QLabel("No critical-path data", self._content)
-            empty.setObjectName("critical_path_empty")
-            self._content_layout.addWidget(empty)
-            self._content_layout.addStretch(1)
+            self._set_rows([])
+            self._empty.show()
             self.update()
             return
+        self._empty.hide()
 
         max_count = max((b.count for b in bars), default=1)
         max_count = max(1, int(max_count))
@@ -100,8 +90,11 @@ class CriticalPathFrequencyWidget(QWidget):
                 tooltip_text = f"{b.count}  {b.label_full}"
                 path_idx += 1
 
+            # max_count bounds every count, so only a (defensive) negative count
+            # needs clamping; rows take the model's ratio as is.
             ratio = float(b.count) / float(max_count)
-            ratio = max(0.0, min(1.0, ratio))
+            if ratio < 0.0:
+                ratio = 0.0
             models.append(
                 _RowModel(
                     label_text=label_text,
@@ -111,15 +104,27 @@ class CriticalPathFrequencyWidget(QWidget):
                 )
             )
 
-        for i, m in enumerate(models, start=1):
-            row = _FrequencyRow(self._content, model=m)
-            row.setObjectName(f"critical_path_row_{i:02d}")
-            self._rows.append(row)
-            self._content_layout.addWidget(row)
-
-        self._content_layout.addStretch(1)
+        self._set_rows(models)
         self.update()
 
+    def _set_rows(self, models: list[_RowModel]) -> None:
+        # Drop surplus rows from the end, update the rest in place, then append
+        # any missing rows before the trailing stretch.
+        while len(self._rows) > len(models):
+            row = self._rows.pop()
+            row.setParent(None)
+            row.deleteLater()
+
+        for row, m in zip(self._rows, models):
+            row.set_model(m)
+
+        for i in range(len(self._rows), len(models)):
+            row = _FrequencyRow(self._content, model=models[i])
+            row.setObjectName(f"critical_path_row_{i + 1:02d}")
+            self._rows.append(row)
+            # Index 0 is the empty placeholder.
+            self._content_layout.insertWidget(i + 1, row)
+
 
 class _FrequencyRow(QWidget):
     _ROW_H = 28
@@ -127,47 +132,60 @@ class _FrequencyRow(QWidget):
     def __init__(self, parent: QWidget, *, model: _RowModel) -> None:
         super().__init__(parent)
         self.setFixedHeight(self._ROW_H)
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(8)
-
-        label = QLabel(model.label_text, self)
-        label.setObjectName("critical_path_label")
-        label.setToolTip(model.tooltip_text)
-        label.setMinimumWidth(86)
-        label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-        layout.addWidget(label, 0)
-
-        bar = _BarWidget(self, ratio=model.ratio)
-        bar.setObjectName("critical_path_bar")
-        bar.setToolTip(model.tooltip_text)
-        layout.addWidget(bar, 1)
-
-        count = QLabel(str(model.count), self)
-        count.setObjectName("critical_path_count")
-        count.setToolTip(model.tooltip_text)
-        count.setMinimumWidth(40)
-        count.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-        layout.addWidget(count, 0)
+        self._ratio = 0.0
+
+        self._layout = QHBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(8)
+
+        self._label = QLabel(self)
+        self._label.setObjectName("critical_path_label")
+        self._label.setMinimumWidth(86)
+        self._label.setAlignment(
+            Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
+        )
+        self._layout.addWidget(self._label, 0)
+
+        # The bar is painted by the row itself in the gap this stretch leaves
+        # between the labels (no per-row bar widget, so one paint per row).
+        self._layout.addStretch(1)
+
+        self._count = QLabel(self)
+        self._count.setObjectName("critical_path_count")
+        self._count.setMinimumWidth(40)
+        self._count.setAlignment(
+            Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
+        )
+        self._layout.addWidget(self._count, 0)
+
+        self.set_model(model)
+
+    def set_model(self, model: _RowModel) -> None:
+        self._label.setText(model.label_text)
+        self._count.setText(str(model.count))
+
+        if model.ratio != self._ratio:
+            self._ratio = model.ratio
+            self.update()
 
         # Ensure hovering any part of the row gives the same answer.
-        self.setToolTip(model.tooltip_text)
-
-
-class _BarWidget(QWidget):
-    def __init__(self, parent: QWidget, *, ratio: float) -> None:
-        super().__init__(parent)
-        self._ratio = max(0.0, min(1.0, float(ratio)))
-        self.setMinimumHeight(_FrequencyRow._ROW_H)
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        for w in (self, self._label, self._count):
+            w.setToolTip(model.tooltip_text)
 
     def paintEvent(self, event) -> None:  # type: ignore[override]
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         p.setRenderHint(QPainter.RenderHint.TextAntialiasing, False)
 
-        rect = self.rect()
+        # Same rect a bar widget would get: between the labels, one layout
+        # spacing away from each.
+        spacing = self._layout.spacing()
+        left = self._label.geometry().right() + 1 + spacing
+        right = self._count.geometry().left() - spacing
+        if right <= left:
+            # Squeezed below label + count + spacing: the bar has no room.
+            return
+        rect = QRect(left, 0, right - left, self.height())
         p.fillRect(rect, self.palette().base())
 
         fill_w = int(round(rect.width() * self._ratio))
@@ -177,4 +195,3 @@ class _BarWidget(QWidget):
         bar_color = QColor(self.palette().text().color())
         bar_color.setAlpha(80)
         p.fillRect(rect.adjusted(0, 6, -(rect.width() - fill_w), -6), bar_color)
-
@@ -11,21 +11,23 @@ Design constraints (v1):
   [`latencylab.metrics.aggregate_runs()`](latencylab/metrics.py:37).
 """
 
+import heapq
 import math
+from bisect import bisect_left
 from collections import Counter
 from dataclasses import dataclass
 
 from latencylab.types import RunResult
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HistogramBin:
     lo: float
     hi: float
     count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CriticalPathBar:
     label_full: str
     label_display: str
@@ -73,7 +75,9 @@ def _percentile_sorted(values_sorted: list[float], p: float) -> float:
     return float(values_sorted[lo] * (1.0 - frac) + values_sorted[hi] * frac)
 
 
-def freedman_diaconis_bins(values: list[float]) -> list[HistogramBin]:
+def freedman_diaconis_bins(
+    values: list[float], *, max_bins: int = 512
+) -> list[HistogramBin]:
     """Compute histogram bins using the Freedman–Diaconis rule.
 
     Documentation requirement (v1):
@@ -83,6 +87,8 @@ def freedman_diaconis_bins(values: list[float]) -> list[HistogramBin]:
     Notes on degenerate inputs:
     - If we cannot compute a positive FD width (e.g., IQR=0), we produce a
       single bin spanning [min, max]. This is deterministic and explainable.
+    - A tiny IQR next to far outliers can ask for a huge number of bins; the
+      count is capped at `max_bins` (bins are then wider than FD's width).
     """
 
     # `values` is typed as list[float], but we still accept mixed inputs from
@@ -114,16 +120,23 @@ def freedman_diaconis_bins(values: list[float]) -> list[HistogramBin]:
         return [HistogramBin(lo=lo, hi=hi, count=len(xs_sorted))]  # pragma: no cover
 
     bin_count = int(math.ceil(span / width))
-    bin_count = max(1, bin_count)
+    bin_count = max(1, min(max_bins, bin_count))
 
     # Recompute width to ensure the final edge covers the max value.
     width = span / bin_count
 
-    counts = [0 for _ in range(bin_count)]
-    for x in xs_sorted:
-        idx = int((x - lo) / width) if width > 0 else 0
-        idx = max(0, min(bin_count - 1, idx))
-        counts[idx] += 1
+    # The bin index int((x - lo) / width) never decreases with x, so on the
+    # sorted values each bin starts where a binary search says it does: this is
+    # O(bins * log n) instead of a Python-level step per value. The last bin
+    # also takes any value whose index lands past it (x == hi).
+    def _bin_index(x: float) -> int:
+        return int((x - lo) / width)
+
+    starts = [0]
+    for i in range(1, bin_count):
+        starts.append(bisect_left(xs_sorted, i, lo=starts[-1], key=_bin_index))
+    starts.append(len(xs_sorted))
+    counts = [end - start for start, end in zip(starts, starts[1:])]
 
     out: list[HistogramBin] = []
     for i, c in enumerate(counts):
@@ -153,24 +166,24 @@ def critical_path_frequency(
     if not counts:
         return []
 
-    ordered = sorted(counts, key=lambda p: (-counts[p], p))
-    top = ordered[:top_n]
-    rest = ordered[top_n:]
+    # Select the top N without sorting the whole long tail; (-count, path)
+    # tuples compare natively, ties broken by path (as in the core summary).
+    top = heapq.nsmallest(top_n, [(-c, p) for p, c in counts.items()])
 
     out: list[CriticalPathBar] = []
-    for path in top:
+    for neg_count, path in top:
         out.append(
             CriticalPathBar(
                 label_full=path,
                 # Display uses the full path string; the chart is responsible for
                 # deterministic wrapping/eliding to available pixels.
                 label_display=path,
-                count=int(counts[path]),
+                count=-neg_count,
             )
         )
 
-    if rest:
-        other_count = int(sum(counts[p] for p in rest))
+    if len(counts) > len(top):
+        other_count = len(ok_paths) - sum(b.count for b in out)
         out.append(
             CriticalPathBar(
                 label_full="Other (long tail)",
@@ -10,8 +10,8 @@ UI principles:
 
 from dataclasses import dataclass
 
-from PySide6.QtCore import QPoint, QRect, Qt
-from PySide6.QtGui import QColor, QFontMetrics, QPainter, QPen
+from PySide6.QtCore import QEvent, QLine, QPoint, QRect, Qt
+from PySide6.QtGui import QColor, QFontMetrics, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QDockWidget,
     QGroupBox,
@@ -32,7 +32,7 @@ from latencylab_ui.run_controller import RunOutputs
 from latencylab_ui.critical_path_frequency_widget import CriticalPathFrequencyWidget
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Marker:
     label: str
     value: float
@@ -94,9 +94,16 @@ class DistributionsDock(QDockWidget):
 
         self.setWidget(root)
 
+        # Last rendered outputs. RunOutputs is frozen, so re-rendering the same
+        # object would recompute identical bins and bars.
+        self._rendered: RunOutputs | None = None
+
     def render(self, outputs: RunOutputs) -> None:
-        ok = [r for r in outputs.runs if not r.failed]
-        makespans = [r.makespan_ms for r in ok]
+        if outputs is self._rendered:
+            return
+        self._rendered = outputs
+
+        makespans = [r.makespan_ms for r in outputs.runs if not r.failed]
         bins = freedman_diaconis_bins(makespans)
 
         p = (
@@ -121,15 +128,57 @@ class _MakespanHistogramWidget(QWidget):
         super().__init__(parent)
         self._bins: list[HistogramBin] = []
         self._markers: list[_Marker] = []
+        # Marker positions as fractions of the data span; only data-dependent,
+        # so computed in set_data() rather than on every chart paint.
+        self._marker_ratios: list[float] = []
+        # The rendered chart; expose/resize-free repaints just blit it. Dropped
+        # whenever the data, size, palette, font or style changes.
+        self._cache: QPixmap | None = None
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
     def set_data(self, *, bins: list[HistogramBin], markers: list[_Marker]) -> None:
         self._bins = list(bins)
         self._markers = list(markers)
+        self._marker_ratios = []
+        if self._bins:
+            data_lo = self._bins[0].lo
+            data_hi = self._bins[-1].hi
+            span = max(1e-9, data_hi - data_lo)
+            self._marker_ratios = [(m.value - data_lo) / span for m in self._markers]
+        self._cache = None
         self.update()
 
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        if event.type() in (
+            QEvent.Type.PaletteChange,
+            QEvent.Type.FontChange,
+            QEvent.Type.StyleChange,
+        ):
+            self._cache = None
+        super().changeEvent(event)
+
     def paintEvent(self, event) -> None:  # type: ignore[override]
+        dpr = self.devicePixelRatioF()
+        cache = self._cache
+        if (
+            cache is None
+            or cache.deviceIndependentSize() != self.size()
+            or cache.devicePixelRatio() != dpr
+        ):
+            cache = QPixmap(self.size() * dpr)
+            cache.setDevicePixelRatio(dpr)
+            cp = QPainter(cache)
+            # A pixmap painter starts with the application font; the chart
+            # text is laid out with (and must be drawn in) the widget's font.
+            cp.setFont(self.font())
+            self._paint_chart(cp)
+            cp.end()
+            self._cache = cache
+
         p = QPainter(self)
+        p.drawPixmap(0, 0, cache)
+
+    def _paint_chart(self, p: QPainter) -> None:
         p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         p.setRenderHint(QPainter.RenderHint.TextAntialiasing, False)
 
@@ -164,16 +213,14 @@ class _MakespanHistogramWidget(QWidget):
 
         n = len(self._bins)
         bar_w = max(1, int(plot.width() / max(1, n)))
+        # All bars share one brush and no pen: draw them in a single call.
+        bars: list[QRect] = []
         for i, b in enumerate(self._bins):
             h = int(round((b.count / max_count) * plot.height()))
             x = plot.left() + i * bar_w
             y = plot.bottom() - h
-            p.drawRect(QRect(x, y, bar_w - 1, h))
-
-        # Marker lines.
-        data_lo = self._bins[0].lo
-        data_hi = self._bins[-1].hi
-        span = max(1e-9, data_hi - data_lo)
+            bars.append(QRect(x, y, bar_w - 1, h))
+        p.drawRects(bars)
 
         # Percentile marker pen: red, deterministic.
         marker_pen = QPen(QColor(220, 60, 60))
@@ -198,14 +245,13 @@ class _MakespanHistogramWidget(QWidget):
 
         marker_xs: list[tuple[_Marker, int]] = []
         # Keep deterministic order: as provided (p50, p90, p95, p99).
-        for m in self._markers:
-            x = plot.left() + int(round(((m.value - data_lo) / span) * plot.width()))
+        for m, ratio in zip(self._markers, self._marker_ratios):
+            x = plot.left() + int(round(ratio * plot.width()))
             x = max(plot.left(), min(plot.right(), x))
             marker_xs.append((m, x))
 
-        # Marker lines stay within the plot area.
-        for _idx, (_m, x) in enumerate(marker_xs, start=1):
-            p.drawLine(x, plot.top(), x, plot.bottom())
+        # Marker lines stay within the plot area; one pen, one call.
+        p.drawLines([QLine(x, plot.top(), x, plot.bottom()) for _m, x in marker_xs])
 
         # Numeric markers under the plot.
         p.setPen(marker_pen)
@@ -8,13 +8,27 @@ from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
     QMainWindow,
-    QMenu,
     QWidget,
 )
 
+from latencylab_ui.focus_cycle_events import (
+    ACTIVATION_KEYS,
+    CHAIN_CHANGE_TYPES,
+    HANDLED_TYPES,
+    KEY_BACKTAB,
+    KEY_LEFT,
+    KEY_RIGHT,
+    KEY_TAB,
+    KEY_TYPES,
+    MENUBAR_HOVER_TYPES,
+    SHIFT_MODIFIER,
+)
 from latencylab_ui.focus_cycle_widgets import (
     collect_interactive_widgets_in_layout_order,
+    focus_within_any as _focus_within_any,
+    index_focus_chain as _index_chain,
     maybe_add_interactive_widget,
+    nearest_ancestor as _nearest_ancestor,
     walk_widget_for_interactive,
 )
 
@@ -39,6 +53,10 @@ class FocusCycleController(QObject):
         self._focus_cycle_started = False
         self._installed = False
         self._last_index: int | None = None
+        # Traversal chain, reused across key presses while installed.
+        self._chain: list[QAction | QWidget] | None = None
+        # id(chain object) -> chain index, built alongside the cached chain.
+        self._chain_index: dict[int, int] = {}
 
     def install(self) -> None:
         if self._installed:  # pragma: no cover
@@ -55,7 +73,7 @@ class FocusCycleController(QObject):
 
         # Ensure we reliably uninstall even if the owner is destroyed without
         # a clean closeEvent path (e.g., some unit tests).
-        self._window.destroyed.connect(lambda *_a: self.uninstall())
+        self._window.destroyed.connect(self._on_owner_destroyed)
 
         self._installed = True
 
@@ -72,9 +90,14 @@ class FocusCycleController(QObject):
 
         try:
             self._window.menuBar().removeEventFilter(self)
+            self._window.destroyed.disconnect(self._on_owner_destroyed)
         except Exception:  # noqa: BLE001
             pass
         self._installed = False
+        self._chain = None
+
+    def _on_owner_destroyed(self, *_args) -> None:
+        self.uninstall()
 
     def ensure_initial_state(self) -> None:
         """Reset to the expected pre-Tab state."""
@@ -101,10 +124,21 @@ class FocusCycleController(QObject):
         if not installed:
             return False
 
+        # The filter sees every event in the application: reject the ones we
+        # never act on before making any Qt calls.
+        event_type = None
+        if isinstance(event, QEvent):
+            event_type = event.type()
+            if event_type not in HANDLED_TYPES:
+                return False
+            if event_type in CHAIN_CHANGE_TYPES:
+                self._chain = None
+                return False
+
         # Qt may invoke eventFilter after the owner window has been deleted.
         # Accessing it would raise RuntimeError.
         try:
-            _ = window.isVisible()
+            visible = window.isVisible()
         except RuntimeError:
             # Best-effort uninstall; swallow any errors.
             try:
@@ -113,26 +147,22 @@ class FocusCycleController(QObject):
                 pass
             return False  # pragma: no cover
 
-        if not window.isVisible():
+        if not visible:
             return super().eventFilter(watched, event)
 
         # Prevent hover-opening menus when a menu title is only active due to our
         # keyboard traversal.
-        if watched is window.menuBar() and event.type() in (
-            QEvent.Type.Enter,
-            QEvent.Type.HoverEnter,
-            QEvent.Type.HoverMove,
-            QEvent.Type.MouseMove,
-        ):
+        menubar = window.menuBar()
+        if watched is menubar and event_type in MENUBAR_HOVER_TYPES:
             popup = QApplication.activePopupWidget()
             if popup is None:
-                window.menuBar().setActiveAction(None)
+                menubar.setActiveAction(None)
                 # Swallow the event so the menubar can't immediately re-activate
                 # an action and open a dropdown on hover.
                 return True
             return super().eventFilter(watched, event)
 
-        if event.type() not in (event.Type.KeyPress, event.Type.KeyRelease):
+        if event_type not in KEY_TYPES:
             return super().eventFilter(watched, event)
 
         key_event = event  # type: ignore[assignment]
@@ -140,7 +170,7 @@ class FocusCycleController(QObject):
             return super().eventFilter(watched, event)  # pragma: no cover
 
         key = key_event.key()
-        mods = key_event.modifiers()
+        is_press = event_type == QEvent.Type.KeyPress
 
         # Activation keys:
         # - Space already triggers QPushButton click by default.
@@ -148,7 +178,7 @@ class FocusCycleController(QObject):
         #   platforms/styles, so we normalize it here.
         #
         # Important: never override input widgets like QComboBox / spin boxes.
-        if event.type() == event.Type.KeyPress and key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+        if is_press and key in ACTIVATION_KEYS:
             fw = QApplication.focusWidget()
             if fw is not None and fw.window() is window:
                 if _focus_within_any(fw, (QComboBox, QAbstractSpinBox)):
@@ -162,12 +192,12 @@ class FocusCycleController(QObject):
                         return True  # pragma: no cover
                     return True
 
-        is_tab = key == Qt.Key.Key_Tab
-        is_backtab = key == Qt.Key.Key_Backtab or (
-            is_tab and (mods & Qt.KeyboardModifier.ShiftModifier)
+        is_tab = key == KEY_TAB
+        is_backtab = key == KEY_BACKTAB or (
+            is_tab and (key_event.modifiers() & SHIFT_MODIFIER)
         )
-        is_right = key == Qt.Key.Key_Right
-        is_left = key == Qt.Key.Key_Left
+        is_right = key == KEY_RIGHT
+        is_left = key == KEY_LEFT
 
         if not (is_tab or is_backtab or is_right or is_left):
             return super().eventFilter(watched, event)
@@ -181,16 +211,14 @@ class FocusCycleController(QObject):
         # the widget area. For traversal purposes, we treat the menu as active
         # when there is an active menu title AND focus is not currently on a
         # child widget of the main window.
-        active_action = window.menuBar().activeAction()
-        focus_on_window_child = (
-            src is not window and src.window() is window
-        )
+        active_action = menubar.activeAction()
+        focus_on_window_child = src is not window and src.window() is window
         menu_active = (active_action is not None) and (not focus_on_window_child)
 
         if src is not window and src.window() is not window and not menu_active:
             return super().eventFilter(watched, event)
 
-        if event.type() == event.Type.KeyRelease:
+        if not is_press:
             # Swallow the release event for keys we handle on press; some
             # platforms/styles update menu focus on release.
             if (is_right or is_left) and not self._focus_cycle_started:
@@ -201,37 +229,24 @@ class FocusCycleController(QObject):
             # Arrow-key traversal is only enabled after first Tab starts the cycle.
             return super().eventFilter(watched, event)
 
-        forward = is_tab or is_right
-        if is_backtab or is_left:
-            forward = False  # pragma: no cover
-
-        # This branch exists to cover the early `forward=False` setting for
-        # Backtab/Left in tests.
-        if not forward and (is_backtab or is_left):  # pragma: no cover
-            pass
+        forward = not (is_backtab or is_left)
 
         # If the menu is active (including when a popup is open), close any
         # active popup and advance relative to the active menu title.
         # This ensures Tab can escape even after Up/Down moved inside the menu.
         if menu_active:
-            # If a dropdown menu is open, dismiss it. Calling close()/hide() can
-            # be unreliable on some platforms; sending Esc to the popup is more
-            # consistently respected.
+            # If a dropdown menu is open, dismiss it. close() can be unreliable
+            # on some platforms; if the popup is still active afterwards, send
+            # it Esc, which is more consistently respected.
             popup = QApplication.activePopupWidget()
             if popup is not None:
                 try:
-                    QApplication.sendEvent(
-                        popup,
-                        QKeyEvent(QKeyEvent.Type.KeyPress, Qt.Key.Key_Escape, Qt.NoModifier),
-                    )
-                    QApplication.sendEvent(
-                        popup,
-                        QKeyEvent(
-                            QKeyEvent.Type.KeyRelease, Qt.Key.Key_Escape, Qt.NoModifier
-                        ),
-                    )
-                    popup.hide()
                     popup.close()
+                    if QApplication.activePopupWidget() is popup:
+                        for t in (QEvent.Type.KeyPress, QEvent.Type.KeyRelease):
+                            QApplication.sendEvent(
+                                popup, QKeyEvent(t, Qt.Key.Key_Escape, Qt.NoModifier)
+                            )
                 except RuntimeError:  # pragma: no cover
                     pass
 
@@ -248,8 +263,7 @@ class FocusCycleController(QObject):
             self._focus_cycle_started = True
             self._last_index = next_idx
 
-            # Apply immediately; if Qt re-asserts menu focus as the popup closes,
-            # retry once on the next event-loop turn.
+            # Apply now; retry next turn if a dismissed popup re-asserts menu focus.
             self._apply(chain[next_idx])
 
             def _retry_apply() -> None:
@@ -258,7 +272,8 @@ class FocusCycleController(QObject):
                 except RuntimeError:  # pragma: no cover
                     return
 
-            QTimer.singleShot(0, _retry_apply)
+            if popup is not None:
+                QTimer.singleShot(0, _retry_apply)
             return True
 
         self._advance(forward=forward)
@@ -296,16 +311,22 @@ class FocusCycleController(QObject):
         self._last_index = next_idx
         self._apply(chain[next_idx])
 
-    def _build_chain(self) -> list[tuple[str, QAction | QWidget]]:
-        chain: list[tuple[str, QAction | QWidget]] = []
-
-        for a in self._window.menuBar().actions():
-            if a.isVisible() and a.isEnabled():
-                chain.append(("menu", a))
-
-        for w in collect_interactive_widgets_in_layout_order(self._window):
-            chain.append(("widget", w))
-
+    def _build_chain(self) -> list[QAction | QWidget]:
+        if self._chain is not None:
+            return self._chain
+
+        # Menu titles (QActions) first, then the interactive widgets.
+        chain: list[QAction | QWidget] = [
+            a
+            for a in self._window.menuBar().actions()
+            if a.isVisible() and a.isEnabled()
+        ]
+        chain.extend(collect_interactive_widgets_in_layout_order(self._window))
+
+        # Only cache while installed: the filter is what invalidates it.
+        if self._installed:
+            self._chain = chain
+            self._chain_index = _index_chain(chain)
         return chain
 
     def _maybe_add_interactive_widget(
@@ -318,7 +339,8 @@ class FocusCycleController(QObject):
     ) -> None:
         walk_widget_for_interactive(self._window, w, out, seen)
 
-    def _current_index(self, chain: list[tuple[str, QAction | QWidget]]) -> int | None:
+    def _current_index(self, chain: list[QAction | QWidget]) -> int | None:
+        index = self._chain_index if chain is self._chain else _index_chain(chain)
         fw = QApplication.focusWidget()
         if fw is None:
             if self._focus_cycle_started and self._last_index is not None:
@@ -327,33 +349,29 @@ class FocusCycleController(QObject):
             active = self._window.menuBar().activeAction()
             if active is None:
                 return None
-            for i, (kind, obj) in enumerate(chain):
-                if kind == "menu" and obj is active:
-                    return i
-            return None  # pragma: no cover
+            return index.get(id(active))
 
         # If focus is on a sub-control (e.g. QSpinBox line edit), walk up.
         w: QWidget | None = fw
         while w is not None and w is not self._window:
-            for i, (kind, obj) in enumerate(chain):
-                if kind == "widget" and obj is w:
-                    return i
+            i = index.get(id(w))
+            if i is not None:
+                return i
             w = w.parentWidget()
 
         # Focus is not on a chain widget; prefer any active menu title.
         active = self._window.menuBar().activeAction()
         if active is not None:
-            for i, (kind, obj) in enumerate(chain):
-                if kind == "menu" and obj is active:
-                    return i
+            i = index.get(id(active))
+            if i is not None:
+                return i
 
         if self._focus_cycle_started and self._last_index is not None:
             return self._last_index  # pragma: no cover
         return None
 
-    def _apply(self, item: tuple[str, QAction | QWidget]) -> None:
-        kind, obj = item
-        if kind == "menu":
+    def _apply(self, obj: QAction | QWidget) -> None:
+        if isinstance(obj, QAction):
             self._window.menuBar().setActiveAction(obj)
             self._window.setFocus(Qt.FocusReason.OtherFocusReason)
             return
@@ -361,9 +379,13 @@ class FocusCycleController(QObject):
         # Leaving the menu bar is a bit fiddly across platforms/styles.
         # Sometimes Qt keeps the menu title "active" and/or drops focus changes
         # on the first attempt. Clear the active menu title and focus the widget
-        # now, then retry once on the next event-loop turn.
+        # now, then retry once on the next event-loop turn (unless this was a
+        # widget-to-widget move that already took effect).
+        leaving_menu = self._window.menuBar().activeAction() is not None
         self._window.menuBar().setActiveAction(None)
         obj.setFocus(Qt.FocusReason.TabFocusReason)
+        if not leaving_menu and QApplication.focusWidget() is obj:
+            return
 
         def _settle_focus() -> None:
             try:
@@ -375,22 +397,3 @@ class FocusCycleController(QObject):
                 return
 
         QTimer.singleShot(0, _settle_focus)
-
-
-def _nearest_ancestor(w: QWidget, cls: type[QWidget]) -> QWidget | None:
-    cur: QWidget | None = w
-    while cur is not None:
-        if isinstance(cur, cls):
-            return cur
-        cur = cur.parentWidget()
-    return None
-
-
-def _focus_within_any(w: QWidget, classes: tuple[type[QWidget], ...]) -> bool:
-    cur: QWidget | None = w
-    while cur is not None:
-        if isinstance(cur, classes):
-            return True
-        cur = cur.parentWidget()
-    return False
-
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QEvent, Qt
+
+# Event types FocusCycleController's application-wide filter acts on; every
+# other event is rejected before any Qt call.
+#
+# Pointer events over the menubar (hover suppression).
+MENUBAR_HOVER_TYPES = frozenset(
+    {
+        QEvent.Type.Enter,
+        QEvent.Type.HoverEnter,
+        QEvent.Type.HoverMove,
+        QEvent.Type.MouseMove,
+    }
+)
+# Key events (traversal/activation).
+KEY_TYPES = frozenset({QEvent.Type.KeyPress, QEvent.Type.KeyRelease})
+# Events after which the cached traversal chain may be stale: widgets or menu
+# titles added, removed, re-laid-out, shown/hidden or enabled/disabled.
+CHAIN_CHANGE_TYPES = frozenset(
+    {
+        QEvent.Type.ChildAdded,
+        QEvent.Type.ChildRemoved,
+        QEvent.Type.ParentChange,
+        QEvent.Type.LayoutRequest,
+        QEvent.Type.Show,
+        QEvent.Type.Hide,
+        QEvent.Type.ShowToParent,
+        QEvent.Type.HideToParent,
+        QEvent.Type.EnabledChange,
+        QEvent.Type.ActionAdded,
+        QEvent.Type.ActionRemoved,
+        QEvent.Type.ActionChanged,
+    }
+)
+HANDLED_TYPES = MENUBAR_HOVER_TYPES | KEY_TYPES | CHAIN_CHANGE_TYPES
+
+# Keys (QKeyEvent.key() values) and modifier the filter handles, bound once so
+# the per-event checks skip the Qt enum attribute lookups.
+KEY_TAB = int(Qt.Key.Key_Tab)
+KEY_BACKTAB = int(Qt.Key.Key_Backtab)
+KEY_LEFT = int(Qt.Key.Key_Left)
+KEY_RIGHT = int(Qt.Key.Key_Right)
+ACTIVATION_KEYS = frozenset({int(Qt.Key.Key_Return), int(Qt.Key.Key_Enter)})
+SHIFT_MODIFIER = Qt.KeyboardModifier.ShiftModifier
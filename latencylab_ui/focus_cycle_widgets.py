@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QAbstractButton,
     QAbstractSpinBox,
@@ -87,3 +88,26 @@ def walk_widget_for_interactive(
         walk_widget_for_interactive(window, w.widget(), out, seen)
         return
 
+
+def nearest_ancestor(w: QWidget, cls: type[QWidget]) -> QWidget | None:
+    cur: QWidget | None = w
+    while cur is not None:
+        if isinstance(cur, cls):
+            return cur
+        cur = cur.parentWidget()
+    return None
+
+
+def focus_within_any(w: QWidget, classes: tuple[type[QWidget], ...]) -> bool:
+    cur: QWidget | None = w
+    while cur is not None:
+        if isinstance(cur, classes):
+            return True
+        cur = cur.parentWidget()
+    return False
+
+
+def index_focus_chain(chain: list[QAction | QWidget]) -> dict[int, int]:
+    # Menu titles are QActions and the rest QWidgets, so one identity map
+    # serves both the focus-widget walk and the active-menu lookup.
+    return {id(obj): i for i, obj in enumerate(chain)}
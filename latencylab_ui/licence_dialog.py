@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtCore import Qt
@@ -51,6 +52,8 @@ class LicenceDialog(QDialog):
         root.addWidget(buttons)
 
 
+# The text is static: read and decode it once per process, not on every open.
+@lru_cache(maxsize=1)
 def _read_lgpl3_text() -> str:
     # The UI is LGPLv3; the text lives in latencylab_ui/LGPL3.txt.
     root = Path(__file__).resolve().parent
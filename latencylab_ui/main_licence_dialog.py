@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtCore import Qt
@@ -46,6 +47,8 @@ class MainLicenceDialog(QDialog):
         root.addWidget(buttons)
 
 
+# LICENSE does not change while the app runs; read it on first open only.
+@lru_cache(maxsize=1)
 def _read_main_license_text() -> str:
     repo_root = Path(__file__).resolve().parents[1]
     return (repo_root / "LICENSE").read_text(encoding="utf-8")
@@ -4,7 +4,7 @@ import time
 from dataclasses import dataclass
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import QEvent, Qt, QTimer
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -178,6 +178,20 @@ class MainWindow(QMainWindow):
         self._controller.shutdown()
         super().closeEvent(event)
 
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        super().changeEvent(event)
+        # Nobody can read the elapsed label while the window is minimized:
+        # stop ticking then, and catch up as soon as it is restored.
+        if event.type() != QEvent.Type.WindowStateChange:
+            return
+        if self._elapsed_started_at is None:
+            return
+        if self.isMinimized():
+            self._elapsed_timer.stop()
+        else:
+            self._update_elapsed()
+            self._elapsed_timer.start()
+
     def _on_theme_changed(self, theme: Theme) -> None:
         app = QApplication.instance()
         if app is not None:
@@ -106,7 +106,7 @@ def on_save_log_clicked(window) -> None:
 
 def load_model(window, path: Path) -> None:
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = json.loads(path.read_bytes())
         model = Model.from_json(raw)
         validate_model(model)
     except ModelValidationError as e:
@@ -4,7 +4,7 @@ import platform
 from collections.abc import Callable
 
 import PySide6
-from PySide6.QtWidgets import QMainWindow, QWidget
+from PySide6.QtWidgets import QDialog, QMainWindow, QWidget
 
 from latencylab.version import __version__
 
@@ -63,23 +63,31 @@ def show_about_dialog(parent: QWidget) -> None:
 def show_licence_dialog(parent: QWidget) -> None:
     from latencylab_ui.licence_dialog import LicenceDialog
 
-    dlg = LicenceDialog(parent)
-    setattr(parent, "_licence_dialog", dlg)
-    dlg.open()
+    _open_kept_dialog(parent, "_licence_dialog", LicenceDialog)
 
 
 def show_main_licence_dialog(parent: QWidget) -> None:
     from latencylab_ui.main_licence_dialog import MainLicenceDialog
 
-    dlg = MainLicenceDialog(parent)
-    setattr(parent, "_main_licence_dialog", dlg)
-    dlg.open()
+    _open_kept_dialog(parent, "_main_licence_dialog", MainLicenceDialog)
 
 
 def show_how_to_read_dialog(parent: QWidget) -> None:
-    dlg = HowToReadDialog(parent)
-    setattr(parent, "_how_to_read_dialog", dlg)
+    _open_kept_dialog(parent, "_how_to_read_dialog", HowToReadDialog)
+
+
+def _open_kept_dialog(
+    parent: QWidget, attr: str, build: Callable[[QWidget], QDialog]
+) -> None:
+    # Text-only dialogs are static: build each one once per parent and
+    # re-open it, rather than constructing and laying out a new one on every
+    # request. The parent owns the dialog; closing it only hides it.
+    dlg = getattr(parent, attr, None)
+    if dlg is None:
+        dlg = build(parent)
+        setattr(parent, attr, dlg)
     dlg.open()
+    dlg.raise_()
 
 
 def _about_text() -> str:
@@ -45,7 +45,7 @@ class RunWorker(QObject):
     @Slot()
     def run(self) -> None:
         try:
-            raw = json.loads(self._request.model_path.read_text(encoding="utf-8"))
+            raw = json.loads(self._request.model_path.read_bytes())
             model = Model.from_json(raw)
             validate_model(model)
 
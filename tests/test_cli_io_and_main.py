@@ -64,6 +64,34 @@ def test_cli_simulate_writes_summary_runs_and_trace(tmp_path: Path) -> None:
     assert out_trace.exists()
 
 
+def test_cli_simulate_workers_flag(tmp_path: Path) -> None:
+    from latencylab.cli import main
+
+    model_path = tmp_path / "m.json"
+    _write_json(model_path, _minimal_v2_model())
+    args = [
+        "simulate",
+        "--model",
+        str(model_path),
+        "--runs",
+        "3",
+        "--seed",
+        "123",
+        "--out-summary",
+        str(tmp_path / "summary.json"),
+        "--out-runs",
+    ]
+
+    assert main([*args, str(tmp_path / "serial.csv")]) == 0
+    assert main([*args, str(tmp_path / "pool.csv"), "--workers", "2"]) == 0
+    assert (tmp_path / "pool.csv").read_bytes() == (
+        tmp_path / "serial.csv"
+    ).read_bytes()
+
+    with pytest.raises(SystemExit):
+        main([*args, str(tmp_path / "bad.csv"), "--workers", "-1"])
+
+
 def test_cli_unhandled_command_raises_assertion(monkeypatch: pytest.MonkeyPatch) -> None:
     import latencylab.cli
 
@@ -190,3 +218,92 @@ def test_io_writers_roundtrip(tmp_path: Path) -> None:
     txt = out_trace.read_text(encoding="utf-8")
     assert "e1;e2" in txt
 
+
+def test_csv_writers_match_csv_module_output(tmp_path: Path) -> None:
+    import csv
+    import io
+
+    from latencylab.io import write_runs_csv, write_trace_csv
+    from latencylab.types import RunResult, TaskInstance
+
+    # Enough rows to flush several batches, with some cells that need quoting.
+    names = ["t", "a,b", 'say "hi"', "multi\nline"]
+    runs = [
+        RunResult(
+            run_id=i,
+            first_ui_event_time_ms=None if i % 3 else 0.1 * i,
+            last_ui_event_time_ms=1.0 / (i + 1),
+            makespan_ms=float(i),
+            critical_path_ms=1e-7 * i,
+            critical_path_tasks=names[i % 4],
+            failed=i % 2 == 1,
+            failure_reason=None if i % 5 else names[i % 4],
+        )
+        for i in range(2500)
+    ]
+    trace = [
+        TaskInstance(
+            instance_id=i,
+            run_id=i // 10,
+            task_name=names[i % 4],
+            context=names[(i // 4) % 4],
+            enqueue_time_ms=0.1 * i,
+            start_time_ms=0.2 * i,
+            end_time_ms=1e22 + i,
+            queue_wait_ms=0.0,
+            duration_ms=1.0 / (i + 1),
+            emitted_events=tuple(names[: i % 3]),
+            parent_task_instance_id=None if i % 2 else i - 1,
+            capacity_parent_instance_id=None if i % 3 else i - 2,
+        )
+        for i in range(2500)
+    ]
+
+    def _expected(header: list[str], rows: list[list[object]]) -> bytes:
+        buf = io.StringIO(newline="")
+        w = csv.writer(buf)
+        w.writerow(header)
+        w.writerows(rows)
+        return buf.getvalue().encode("utf-8")
+
+    write_runs_csv(tmp_path / "runs.csv", runs)
+    write_trace_csv(tmp_path / "trace.csv", trace)
+
+    runs_bytes = (tmp_path / "runs.csv").read_bytes()
+    assert runs_bytes == _expected(
+        runs_bytes.decode("utf-8").split("\r\n", 1)[0].split(","),
+        [
+            [
+                r.run_id,
+                r.first_ui_event_time_ms,
+                r.last_ui_event_time_ms,
+                r.makespan_ms,
+                r.critical_path_ms,
+                r.critical_path_tasks,
+                int(r.failed),
+                r.failure_reason or "",
+            ]
+            for r in runs
+        ],
+    )
+    trace_bytes = (tmp_path / "trace.csv").read_bytes()
+    assert trace_bytes == _expected(
+        trace_bytes.decode("utf-8").split("\r\n", 1)[0].split(","),
+        [
+            [
+                t.run_id,
+                t.instance_id,
+                t.task_name,
+                t.context,
+                t.enqueue_time_ms,
+                t.start_time_ms,
+                t.end_time_ms,
+                t.queue_wait_ms,
+                t.duration_ms,
+                t.parent_task_instance_id,
+                t.capacity_parent_instance_id,
+                ";".join(t.emitted_events),
+            ]
+            for t in trace
+        ],
+    )
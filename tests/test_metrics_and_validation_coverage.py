@@ -63,6 +63,31 @@ def test_metrics_percentile_edges_p0_p100_and_singleton() -> None:
     assert _percentile_sorted([5.0], 50) == 5.0
 
 
+def test_metrics_top_paths_are_count_desc_then_path_and_capped_at_ten() -> None:
+    model = Model.from_json(_base_model())
+    # 12 distinct paths: "p00" x1 .. "p11" x12, plus a tie for the top count.
+    paths = [f"p{i:02d}" for i in range(12) for _ in range(i + 1)] + ["z"] * 12
+    runs = [
+        RunResult(
+            run_id=i,
+            first_ui_event_time_ms=0.0,
+            last_ui_event_time_ms=1.0,
+            makespan_ms=1.0,
+            critical_path_ms=1.0,
+            critical_path_tasks=path,
+            failed=False,
+            failure_reason=None,
+        )
+        for i, path in enumerate(paths)
+    ]
+
+    top = aggregate_runs(model=model, runs=runs)["critical_path"]["top_paths"]
+
+    assert [(p["tasks"], p["count"]) for p in top] == [("p11", 12), ("z", 12)] + [
+        (f"p{i:02d}", i + 1) for i in range(10, 2, -1)
+    ]
+
+
 def test_add_task_metadata_v2_adds_and_v1_does_not() -> None:
     m2 = Model.from_json(_base_model())
     s = aggregate_runs(
@@ -7,18 +7,23 @@ from latencylab.sim import simulate_many
 
 
 def test_v2_delay_parse_errors_and_sampler_unhandled_dist() -> None:
-    from latencylab.sim_v2 import _sample_ms
+    from latencylab.sim_v2_plan import compile_sampler, dist_spec
     from latencylab.model import DurationDist
     import random
 
-    with pytest.raises(AssertionError, match="unhandled dist"):
-        _sample_ms(__import__("random").Random(1), DurationDist(dist="weird", params={}))
+    def _sample(rng: random.Random, dist: DurationDist) -> float:
+        return compile_sampler(dist_spec(dist))(rng)
+
+    # Unknown dists compile to a sampler that raises when drawn from.
+    weird = compile_sampler(dist_spec(DurationDist(dist="weird", params={})))
+    with pytest.raises(AssertionError, match="unhandled dist: weird"):
+        weird(random.Random(1))
 
     # Cover all supported distributions in sampler.
     rng = random.Random(0)
-    assert _sample_ms(rng, DurationDist(dist="fixed", params={"value": 1.0})) == 1.0
-    assert _sample_ms(rng, DurationDist(dist="normal", params={"mean": 0.0, "std": 0.0})) == 0.0
-    v = _sample_ms(rng, DurationDist(dist="lognormal", params={"mu": 0.0, "sigma": 0.0}))
+    assert _sample(rng, DurationDist(dist="fixed", params={"value": 1.0})) == 1.0
+    assert _sample(rng, DurationDist(dist="normal", params={"mean": 0.0, "std": 0.0})) == 0.0
+    v = _sample(rng, DurationDist(dist="lognormal", params={"mu": 0.0, "sigma": 0.0}))
     assert v == 1.0
 
 
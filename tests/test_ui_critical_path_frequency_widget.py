@@ -115,9 +115,78 @@ def test_critical_path_frequency_widget_zero_count_bar_paints_safely() -> None:
 
     assert len(w._rows) == 1  # noqa: SLF001
 
+    # A (defensive) negative count is clamped to an empty bar as well.
+    w.set_data([CriticalPathBar(label_full="N", label_display="N", count=-3)])
+    _spin(app)
+    assert w._rows[0]._ratio == 0.0  # noqa: SLF001
+
     # `grab()` forces a paint without manually calling paintEvent.
     _ = w._rows[0].grab()  # noqa: SLF001
 
+    # Squeezed below label + count + spacing: the collapsed bar must not
+    # paint a stripe of base colour over the gap between the labels.
+    host.resize(140, 160)
+    _spin(app)
+    row = w._rows[0]  # noqa: SLF001
+    spacing = row._layout.spacing()  # noqa: SLF001
+    left = row._label.geometry().right() + 1 + spacing  # noqa: SLF001
+    right = row._count.geometry().left() - spacing  # noqa: SLF001
+    assert right < left
+
+    img = row.grab().toImage()
+    base = row.palette().base().color().rgb()
+    y = row.height() // 2
+    assert all(img.pixel(x, y) != base for x in range(max(0, right), left))
+
     host.close()
     _spin(app)
 
+
+def test_critical_path_frequency_widget_reuses_rows_across_renders() -> None:
+    app = _ensure_qapp()
+
+    from PySide6.QtWidgets import QLabel, QMainWindow
+
+    from latencylab_ui.critical_path_frequency_widget import (
+        CriticalPathFrequencyWidget,
+    )
+    from latencylab_ui.distributions_agg import CriticalPathBar
+
+    host = QMainWindow()
+    w = CriticalPathFrequencyWidget(host)
+    host.setCentralWidget(w)
+    host.resize(520, 220)
+    host.show()
+    _spin(app)
+
+    w.set_data(
+        [
+            CriticalPathBar(label_full="A", label_display="A", count=4),
+            CriticalPathBar(label_full="B", label_display="B", count=2),
+        ]
+    )
+    _spin(app)
+    first = list(w._rows)  # noqa: SLF001
+
+    w.set_data(
+        [
+            CriticalPathBar(label_full="C", label_display="C", count=3),
+            CriticalPathBar(label_full="D", label_display="D", count=3),
+        ]
+    )
+    _spin(app)
+    assert w._rows == first  # noqa: SLF001
+    assert [r.toolTip() for r in w._rows] == ["3  C", "3  D"]  # noqa: SLF001
+    counts = [
+        r.findChild(QLabel, "critical_path_count").text()
+        for r in w._rows  # noqa: SLF001
+    ]
+    assert counts == ["3", "3"]
+
+    w.set_data([])
+    _spin(app)
+    assert not w._rows  # noqa: SLF001
+    assert not w.findChild(QLabel, "critical_path_empty").isHidden()
+
+    host.close()
+    _spin(app)
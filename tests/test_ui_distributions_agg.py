@@ -126,3 +126,73 @@ def test_critical_path_frequency_top10_and_other_sorted_and_full_display() -> No
     # Strict sort: highest count first.
     assert bars[0].count > bars[1].count
 
+
+def test_freedman_diaconis_bins_match_per_value_binning() -> None:
+    import math
+    import random
+
+    from latencylab_ui.distributions_agg import freedman_diaconis_bins
+
+    rng = random.Random(5)
+    for n in (2, 3, 17, 500):
+        xs = [rng.lognormvariate(3.0, 0.8) for _ in range(n)] + [1.0, 1.0]
+        bins = freedman_diaconis_bins(xs)
+
+        lo = min(xs)
+        width = (max(xs) - lo) / len(bins)
+        expected = [0] * len(bins)
+        for x in xs:
+            expected[min(len(bins) - 1, int((x - lo) / width))] += 1
+        assert [b.count for b in bins] == expected
+        assert math.isclose(bins[-1].hi, max(xs))
+
+
+def test_freedman_diaconis_bins_caps_bin_count() -> None:
+    from latencylab_ui.distributions_agg import freedman_diaconis_bins
+
+    # Tight cluster (tiny IQR) plus one far outlier: FD alone would ask for
+    # millions of bins.
+    xs = [i * 1e-3 for i in range(100)] + [1e6]
+
+    bins = freedman_diaconis_bins(xs)
+    assert len(bins) == 512
+    assert sum(b.count for b in bins) == len(xs)
+    assert bins[0].count == 100 and bins[-1].count == 1
+
+    assert len(freedman_diaconis_bins(xs, max_bins=4)) == 4
+
+
+def test_critical_path_frequency_ties_by_path_and_long_tail_count() -> None:
+    from latencylab.types import RunResult
+    from latencylab_ui.distributions_agg import critical_path_frequency
+
+    paths = ["B", "A", "C", "C", "D", "E", "B"]
+    runs = [
+        RunResult(
+            run_id=i,
+            first_ui_event_time_ms=None,
+            last_ui_event_time_ms=None,
+            makespan_ms=1.0,
+            critical_path_ms=1.0,
+            critical_path_tasks=path,
+            failed=False,
+            failure_reason=None,
+        )
+        for i, path in enumerate(paths)
+    ]
+
+    bars = critical_path_frequency(runs, top_n=3)
+    assert [(b.label_full, b.count) for b in bars] == [
+        ("B", 2),
+        ("C", 2),
+        ("A", 1),
+        ("Other (long tail)", 2),
+    ]
+    assert len(critical_path_frequency(runs, top_n=5)) == 5
+
+
+def test_freedman_diaconis_bins_skips_none_and_non_finite_values() -> None:
+    from latencylab_ui.distributions_agg import freedman_diaconis_bins
+
+    mixed = [None, float("nan"), 1, float("inf"), 3.0, -float("inf"), 0.0, 2]
+    assert freedman_diaconis_bins(mixed) == freedman_diaconis_bins([0.0, 1.0, 2.0, 3.0])
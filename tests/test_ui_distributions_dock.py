@@ -150,3 +150,124 @@ def test_distributions_dock_renders_and_paints_empty() -> None:
     host.close()
     _spin(app)
 
+
+def test_makespan_histogram_caches_rendered_chart_until_inputs_change() -> None:
+    app = _ensure_qapp()
+
+    from PySide6.QtGui import QColor, QPalette
+    from PySide6.QtWidgets import QWidget
+
+    from latencylab_ui.distributions_agg import HistogramBin
+    from latencylab_ui.distributions_dock import _Marker, _MakespanHistogramWidget
+
+    host = QWidget()
+    chart = _MakespanHistogramWidget(host)
+    chart.resize(300, 200)
+    chart.set_data(
+        bins=[HistogramBin(lo=0.0, hi=1.0, count=2)],
+        markers=[_Marker(label="p50 = 0.5", value=0.5)],
+    )
+
+    first = chart.grab().toImage()
+    cache = chart._cache  # noqa: SLF001
+    assert cache is not None
+    assert chart.grab().toImage() == first
+    assert chart._cache is cache  # noqa: SLF001
+
+    chart.resize(320, 200)
+    chart.grab()
+    assert chart._cache is not cache  # noqa: SLF001
+
+    pal = chart.palette()
+    pal.setColor(QPalette.ColorRole.Base, QColor(1, 2, 3))
+    chart.setPalette(pal)
+    assert chart._cache is None  # noqa: SLF001
+
+    chart.grab()
+    chart.set_data(bins=[], markers=[])
+    assert chart._cache is None  # noqa: SLF001
+
+    host.close()
+    _spin(app)
+
+
+def test_makespan_histogram_cached_chart_matches_direct_paint_under_theme() -> None:
+    app = _ensure_qapp()
+
+    from PySide6.QtGui import QPainter
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+    from latencylab_ui.distributions_agg import HistogramBin
+    from latencylab_ui.distributions_dock import _Marker, _MakespanHistogramWidget
+    from latencylab_ui.theme import Theme, apply_theme
+
+    class _DirectChart(_MakespanHistogramWidget):
+        # Paints straight onto the widget, bypassing the pixmap cache.
+        def paintEvent(self, event) -> None:  # type: ignore[override]
+            p = QPainter(self)
+            self._paint_chart(p)
+            p.end()
+
+    apply_theme(app, Theme.LIGHT)
+    try:
+        host = QWidget()
+        layout = QVBoxLayout(host)
+        charts = [_MakespanHistogramWidget(host), _DirectChart(host)]
+        for chart in charts:
+            layout.addWidget(chart)
+            chart.set_data(
+                bins=[HistogramBin(lo=0.0, hi=1.0, count=2)],
+                markers=[
+                    _Marker(label="p50 = 0.5", value=0.5),
+                    _Marker(label="p90 = 0.9", value=0.9),
+                ],
+            )
+        host.resize(400, 700)
+        host.show()
+        _spin(app)
+
+        cached, direct = charts
+        assert cached.size() == direct.size()
+        assert cached.grab().toImage() == direct.grab().toImage()
+        assert cached._cache is not None  # noqa: SLF001
+
+        host.close()
+        _spin(app)
+    finally:
+        app.setStyleSheet("")
+
+
+def test_distributions_dock_skips_rerender_of_same_outputs(monkeypatch) -> None:
+    app = _ensure_qapp()
+
+    from PySide6.QtWidgets import QMainWindow
+
+    from latencylab.model import Model
+    from latencylab_ui.distributions_dock import DistributionsDock
+    from latencylab_ui.run_controller import RunOutputs
+
+    host = QMainWindow()
+    dock = DistributionsDock(host)
+    model = Model(
+        version=2,
+        entry_event="start",
+        contexts={},
+        events={},
+        tasks={},
+        wiring={},
+        wiring_edges={},
+    )
+
+    calls: list[object] = []
+    monkeypatch.setattr(dock._cp_list, "set_data", calls.append)  # noqa: SLF001
+
+    first = RunOutputs(model=model, runs=[], summary={})
+    dock.render(first)
+    dock.render(first)
+    assert len(calls) == 1
+
+    dock.render(RunOutputs(model=model, runs=[], summary={}))
+    assert len(calls) == 2
+
+    host.close()
+    _spin(app)
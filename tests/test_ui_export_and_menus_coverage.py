@@ -166,6 +166,14 @@ def test_show_license_dialogs_set_parent_refs() -> None:
     menus.show_main_licence_dialog(parent)
     assert getattr(parent, "_main_licence_dialog") is not None
 
+    # Re-opening reuses the dialogs built above.
+    licence = getattr(parent, "_licence_dialog")
+    main_licence = getattr(parent, "_main_licence_dialog")
+    menus.show_licence_dialog(parent)
+    menus.show_main_licence_dialog(parent)
+    assert getattr(parent, "_licence_dialog") is licence
+    assert getattr(parent, "_main_licence_dialog") is main_licence
+
 
 def test_show_how_to_read_dialog_sets_parent_ref() -> None:
     from PySide6.QtWidgets import QApplication, QWidget
@@ -182,6 +190,12 @@ def test_show_how_to_read_dialog_sets_parent_ref() -> None:
     assert dlg.width() >= 608
     assert dlg.height() >= 700
 
+    # Re-opening reuses the same dialog instead of building another one.
+    dlg.close()
+    menus.show_how_to_read_dialog(parent)
+    assert getattr(parent, "_how_to_read_dialog") is dlg
+    assert dlg.isVisible()
+
 
 def test_top_bar_how_to_read_button_opens_same_dialog_via_main_window() -> None:
     from PySide6.QtCore import QObject, Signal
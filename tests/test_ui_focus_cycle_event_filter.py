@@ -213,3 +213,167 @@ def test_focus_cycle_uninstall_ignores_menubar_remove_event_filter_errors() -> N
     w.close()
     app.processEvents()
 
+
+def test_focus_cycle_event_filter_rejects_unhandled_types_before_qt_calls() -> None:
+    _ensure_qapp()
+
+    from PySide6.QtCore import QEvent
+    from PySide6.QtWidgets import QMainWindow
+
+    from latencylab_ui.focus_cycle import FocusCycleController
+
+    class _BrokenWindow:
+        def isVisible(self):
+            raise AssertionError("window must not be touched")
+
+    c = FocusCycleController(QMainWindow())
+    c._installed = True  # noqa: SLF001
+    c._window = _BrokenWindow()  # type: ignore[assignment]
+
+    for t in (QEvent.Type.Paint, QEvent.Type.Timer, QEvent.Type.Resize):
+        assert c.eventFilter(None, QEvent(t)) is False
+
+
+def test_focus_cycle_chain_is_cached_until_widgets_change() -> None:
+    app = _ensure_qapp()
+
+    from PySide6.QtWidgets import QMainWindow, QPushButton, QVBoxLayout, QWidget
+
+    from latencylab_ui.focus_cycle import FocusCycleController
+
+    w = QMainWindow()
+    w.menuBar().addMenu("File")
+    root = QWidget()
+    root.setLayout(QVBoxLayout())
+    w.setCentralWidget(root)
+    a = QPushButton("A")
+    b = QPushButton("B")
+    root.layout().addWidget(a)
+    root.layout().addWidget(b)
+    w.show()
+    app.processEvents()
+
+    c = FocusCycleController(w)
+    c.install()
+    try:
+        chain = c._build_chain()  # noqa: SLF001
+        assert c._build_chain() is chain  # noqa: SLF001
+        assert chain[1:] == [a, b]
+
+        # Enabled-state and child changes reach the app-wide filter and drop
+        # the cached chain.
+        a.setEnabled(False)
+        assert c._build_chain()[1:] == [b]  # noqa: SLF001
+
+        extra = QPushButton("C")
+        root.layout().addWidget(extra)
+        app.processEvents()
+        assert c._build_chain()[1:] == [b, extra]  # noqa: SLF001
+    finally:
+        c.uninstall()
+        w.close()
+        app.processEvents()
+
+
+def test_focus_cycle_widget_to_widget_tab_schedules_no_retry(monkeypatch) -> None:
+    app = _ensure_qapp()
+
+    from PySide6.QtCore import QEvent, Qt
+    from PySide6.QtGui import QKeyEvent
+    from PySide6.QtWidgets import QMainWindow, QPushButton, QVBoxLayout, QWidget
+
+    from latencylab_ui import focus_cycle
+    from latencylab_ui.focus_cycle import FocusCycleController
+
+    w = QMainWindow()
+    root = QWidget()
+    root.setLayout(QVBoxLayout())
+    w.setCentralWidget(root)
+    a = QPushButton("A")
+    b = QPushButton("B")
+    root.layout().addWidget(a)
+    root.layout().addWidget(b)
+    w.show()
+    w.activateWindow()
+    app.processEvents()
+
+    c = FocusCycleController(w)
+    c.install()
+    try:
+        a.setFocus()
+        app.processEvents()
+        assert a.hasFocus()
+
+        scheduled: list[object] = []
+        monkeypatch.setattr(
+            focus_cycle.QTimer, "singleShot", lambda *args: scheduled.append(args)
+        )
+        press = QKeyEvent(QEvent.Type.KeyPress, Qt.Key.Key_Tab, Qt.NoModifier)
+        assert c.eventFilter(a, press) is True
+        assert b.hasFocus()
+        assert scheduled == []
+    finally:
+        c.uninstall()
+        w.close()
+        app.processEvents()
+
+
+def test_focus_cycle_tab_closes_open_menu_popup() -> None:
+    app = _ensure_qapp()
+
+    from PySide6.QtCore import QEvent, QPoint, Qt
+    from PySide6.QtGui import QKeyEvent
+    from PySide6.QtWidgets import QApplication, QMainWindow, QPushButton
+
+    from latencylab_ui.focus_cycle import FocusCycleController
+
+    w = QMainWindow()
+    menu = w.menuBar().addMenu("File")
+    menu.addAction("Open")
+    btn = QPushButton("Run")
+    w.setCentralWidget(btn)
+    w.show()
+    w.activateWindow()
+    app.processEvents()
+
+    c = FocusCycleController(w)
+    c.install()
+    try:
+        w.menuBar().setActiveAction(menu.menuAction())
+        menu.popup(QPoint(0, 0))
+        app.processEvents()
+        assert QApplication.activePopupWidget() is menu
+
+        press = QKeyEvent(QEvent.Type.KeyPress, Qt.Key.Key_Tab, Qt.NoModifier)
+        assert c.eventFilter(menu, press) is True
+        assert QApplication.activePopupWidget() is None
+        assert not menu.isVisible()
+        assert btn.hasFocus()
+    finally:
+        c.uninstall()
+        w.close()
+        app.processEvents()
+
+
+def test_focus_cycle_reinstall_does_not_stack_destroyed_connections() -> None:
+    app = _ensure_qapp()
+
+    from PySide6.QtCore import SIGNAL
+    from PySide6.QtWidgets import QMainWindow
+
+    from latencylab_ui.focus_cycle import FocusCycleController
+
+    w = QMainWindow()
+    w.show()
+    app.processEvents()
+
+    destroyed = SIGNAL("destroyed(QObject*)")
+    c = FocusCycleController(w)
+    for _ in range(2):
+        c.install()
+        assert w.receivers(destroyed) == 1
+        c.uninstall()
+        assert w.receivers(destroyed) == 0
+
+    w.close()
+    app.processEvents()
@@ -229,3 +229,56 @@ def test_distributions_visibility_change_sets_closed_during_run_flag() -> None:
     w.close()
     app.processEvents()
 
+
+def test_elapsed_ticker_pauses_while_minimized(monkeypatch) -> None:
+    app = _ensure_qapp()
+
+    from PySide6.QtCore import QEvent, QObject, Signal
+
+    from latencylab_ui.main_window import MainWindow
+
+    class _Controller(QObject):
+        started = Signal(int)
+        succeeded = Signal(int, object)
+        failed = Signal(int, str)
+        finished = Signal(int, float)
+
+        def is_running(self) -> bool:
+            return True
+
+        def is_cancelled(self, _token: int) -> bool:
+            return False
+
+        def shutdown(self) -> None:
+            return None
+
+    w = MainWindow(run_controller=_Controller())
+    w.show()
+    app.processEvents()
+
+    # Not running: state changes leave the ticker alone.
+    w.changeEvent(QEvent(QEvent.Type.WindowStateChange))
+    assert w._elapsed_timer.isActive() is False
+
+    w._on_run_started(1)
+    assert w._elapsed_timer.isActive() is True
+
+    monkeypatch.setattr(w, "isMinimized", lambda: True)
+    w.changeEvent(QEvent(QEvent.Type.WindowStateChange))
+    assert w._elapsed_timer.isActive() is False
+
+    # Restoring catches the label up immediately and resumes ticking.
+    w._elapsed_label.setText("")
+    monkeypatch.setattr(w, "isMinimized", lambda: False)
+    w.changeEvent(QEvent(QEvent.Type.WindowStateChange))
+    assert w._elapsed_timer.isActive() is True
+    assert w._elapsed_label.text().endswith("s")
+
+    # Unrelated change events are ignored.
+    w._elapsed_timer.stop()
+    w.changeEvent(QEvent(QEvent.Type.FontChange))
+    assert w._elapsed_timer.isActive() is False
+
+    w._on_run_finished(1, 0.1)
+    w.close()
+    app.processEvents()
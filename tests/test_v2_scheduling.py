@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from latencylab.model import Model
+from latencylab.sim import simulate_many
+from latencylab.validate import validate_model
+
+
+def _fixed(value: float) -> dict:
+    return {"dist": "fixed", "value": value}
+
+
+def test_v2_allocates_lowest_free_slot_after_out_of_order_release() -> None:
+    # a holds slot 0 until t=5; b holds slot 1 until t=1. Slot 1 is released
+    # first, but d (started at t=11) must still take the lowest free slot (0).
+    model = Model.from_json(
+        {
+            "schema_version": 2,
+            "entry_event": "e0",
+            "contexts": {"bg": {"concurrency": 2}},
+            "events": {"e0": {"tags": []}, "e1": {"tags": []}},
+            "tasks": {
+                "a": {"context": "bg", "duration_ms": _fixed(5.0)},
+                "b": {"context": "bg", "duration_ms": _fixed(1.0), "emit": ["e1"]},
+                "d": {"context": "bg", "duration_ms": _fixed(1.0)},
+            },
+            "wiring": {
+                "e0": ["a", "b"],
+                "e1": [{"task": "d", "delay_ms": 10.0}],
+            },
+        }
+    )
+    validate_model(model)
+
+    _, trace = simulate_many(
+        model=model, runs=1, seed=1, max_tasks_per_run=10, want_trace=True
+    )
+    by_name = {t.task_name: t for t in trace}
+
+    assert by_name["d"].start_time_ms == 11.0
+    assert by_name["d"].capacity_parent_instance_id == by_name["a"].instance_id
+
+
+def test_v2_plan_interns_names_and_simulate_one_compiles_on_demand() -> None:
+    import random
+
+    from latencylab.sim_v2 import simulate_one
+    from latencylab.sim_v2_plan import compile_model
+
+    model = Model.from_json(
+        {
+            "schema_version": 2,
+            "entry_event": "e0",
+            "contexts": {"ui": {"concurrency": 1}, "bg": {"concurrency": 2}},
+            "events": {"e0": {"tags": ["ui"]}},
+            "tasks": {
+                "t0": {"context": "bg", "duration_ms": _fixed(1.0), "emit": ["e1"]},
+                "t1": {"context": "ui", "duration_ms": _fixed(2.0)},
+            },
+            # e1 is emitted and wired but never declared (unvalidated model).
+            "wiring": {"e0": ["t0"], "e1": [{"task": "t1", "delay_ms": 3.0}]},
+        }
+    )
+    plan = compile_model(model)
+
+    assert plan.ctx_names == ("ui", "bg")
+    assert plan.event_names == ("e0", "e1")
+    assert plan.event_is_ui == (True, False)
+    assert plan.task_ctx == (1, 0)
+    # One delay edge (key 0); then t1 on "ui" sorts after t0 on "bg".
+    assert plan.task_order == (1 + 0 * 2 + 0, 1 + 1 * 2 + 1)
+    assert plan.task_duration == (("fixed", 1.0, 0.0, 0.0), ("fixed", 2.0, 0.0, 0.0))
+    assert plan.task_emit == ((1,), ())
+    assert plan.task_fixed_ms == (1.0, 2.0)
+    assert plan.immediate_by_event[:2] == ((0,), ())
+    assert plan.delays_by_event[1][0][2] == "delay(e1->t1)"
+
+    run, trace = simulate_one(
+        model=model,
+        run_id=0,
+        rng=random.Random(0),
+        max_tasks_per_run=10,
+        want_trace=True,
+    )
+    assert run.critical_path_tasks == "t0>delay(e1->t1)>t1"
+    assert run.makespan_ms == 6.0
+    assert [t.context for t in trace] == ["bg", "__delay__", "ui"]
+
+
+def test_v2_trace_materialization_does_not_change_run_results() -> None:
+    model = Model.from_json(
+        json.loads(Path("stellody_music_discovery.json").read_text(encoding="utf-8"))
+    )
+    validate_model(model)
+
+    runs_t, trace = simulate_many(
+        model=model, runs=5, seed=7, max_tasks_per_run=1000, want_trace=True
+    )
+    runs_n, no_trace = simulate_many(
+        model=model, runs=5, seed=7, max_tasks_per_run=1000, want_trace=False
+    )
+
+    assert runs_t == runs_n
+    assert no_trace == []
+    assert [t.instance_id for t in trace if t.run_id == 0] == list(
+        range(1, 1 + sum(1 for t in trace if t.run_id == 0))
+    )
+    assert all(t.queue_wait_ms == t.start_time_ms - t.enqueue_time_ms for t in trace)
+
+
+def test_v2_starts_round_robin_across_contexts_in_model_order() -> None:
+    # Ready contexts are drained one start per context per round, in model
+    # order; instance ids (and hence RNG draw order) depend on this.
+    model = Model.from_json(
+        {
+            "schema_version": 2,
+            "entry_event": "e0",
+            "contexts": {"zz": {"concurrency": 2}, "aa": {"concurrency": 3}},
+            "events": {"e0": {"tags": []}},
+            "tasks": {
+                "a": {"context": "aa", "duration_ms": _fixed(1.0)},
+                "z": {"context": "zz", "duration_ms": _fixed(1.0)},
+            },
+            "wiring": {"e0": ["a", "a", "a", "z", "z", "z"]},
+        }
+    )
+
+    _, trace = simulate_many(
+        model=model, runs=1, seed=1, max_tasks_per_run=10, want_trace=True
+    )
+
+    assert [(t.task_name, t.start_time_ms) for t in trace] == [
+        ("z", 0.0),
+        ("a", 0.0),
+        ("z", 0.0),
+        ("a", 0.0),
+        ("a", 0.0),
+        ("z", 1.0),
+    ]
+
+
+def test_v2_same_time_completions_are_processed_in_name_order() -> None:
+    # "zz" is declared (and started) first, but both tasks finish at t=1 and
+    # completions are processed by (context name, task name): the delay
+    # scheduled by "a" must therefore get the lower instance id.
+    model = Model.from_json(
+        {
+            "schema_version": 2,
+            "entry_event": "e0",
+            "contexts": {"zz": {"concurrency": 1}, "aa": {"concurrency": 1}},
+            "events": {"e0": {"tags": []}, "ez": {"tags": []}, "ea": {"tags": []}},
+            "tasks": {
+                "z": {"context": "zz", "duration_ms": _fixed(1.0), "emit": ["ez"]},
+                "a": {"context": "aa", "duration_ms": _fixed(1.0), "emit": ["ea"]},
+                "z2": {"context": "zz", "duration_ms": _fixed(1.0)},
+                "a2": {"context": "aa", "duration_ms": _fixed(1.0)},
+            },
+            "wiring": {
+                "e0": ["z", "a"],
+                "ez": [{"task": "z2", "delay_ms": 0.0}],
+                "ea": [{"task": "a2", "delay_ms": 0.0}],
+            },
+        }
+    )
+    validate_model(model)
+
+    _, trace = simulate_many(
+        model=model, runs=1, seed=1, max_tasks_per_run=10, want_trace=True
+    )
+
+    assert [t.task_name for t in trace][:4] == [
+        "z",
+        "a",
+        "delay(ea->a2)",
+        "delay(ez->z2)",
+    ]
+
+
+def test_v2_parallel_runs_match_serial_runs() -> None:
+    from latencylab.sim_v2_parallel import shard_ranges
+
+    assert shard_ranges(10, 4) == [range(0, 2), range(2, 5), range(5, 7), range(7, 10)]
+
+    model = Model.from_json(
+        json.loads(Path("stellody_music_discovery.json").read_text(encoding="utf-8"))
+    )
+    validate_model(model)
+
+    serial = simulate_many(
+        model=model, runs=9, seed=3, max_tasks_per_run=1000, want_trace=True
+    )
+    for workers in (2, 0):
+        assert (
+            simulate_many(
+                model=model,
+                runs=9,
+                seed=3,
+                max_tasks_per_run=1000,
+                want_trace=True,
+                workers=workers,
+            )
+            == serial
+        )
+
+
+def test_v2_pool_worker_runs_shards_from_initializer_state(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # The initializer/shard helpers normally only run in worker processes.
+    from latencylab import sim_v2_parallel
+    from latencylab.sim_v2 import _simulate_range
+
+    model = Model.from_json(
+        json.loads(Path("stellody_music_discovery.json").read_text(encoding="utf-8"))
+    )
+    monkeypatch.setattr(sim_v2_parallel, "_worker_args", None)
+    sim_v2_parallel._init_worker(_simulate_range, model, 5, 1000, True)
+
+    runs, trace = sim_v2_parallel._run_shard(range(2, 4))
+    serial_runs, serial_trace = simulate_many(
+        model=model, runs=4, seed=5, max_tasks_per_run=1000, want_trace=True
+    )
+
+    assert runs == serial_runs[2:]
+    assert trace == [t for t in serial_trace if t.run_id >= 2]
+
+
+def test_v2_zero_length_completions_run_before_later_completions() -> None:
+    # Zero-duration tasks and zero delays complete at the current time and
+    # form the next batch at that time, ahead of anything later in the heap.
+    model = Model.from_json(
+        {
+            "schema_version": 2,
+            "entry_event": "e0",
+            "contexts": {"bg": {"concurrency": 2}},
+            "events": {"e0": {"tags": []}, "e1": {"tags": ["ui"]}},
+            "tasks": {
+                "slow": {"context": "bg", "duration_ms": _fixed(1.0)},
+                "zero": {"context": "bg", "duration_ms": _fixed(0.0), "emit": ["e1"]},
+                "after": {"context": "bg", "duration_ms": _fixed(0.0)},
+            },
+            "wiring": {
+                "e0": ["slow", "zero"],
+                "e1": [{"task": "after", "delay_ms": 0.0}],
+            },
+        }
+    )
+    validate_model(model)
+
+    runs, trace = simulate_many(
+        model=model, runs=1, seed=1, max_tasks_per_run=10, want_trace=True
+    )
+
+    assert [(t.task_name, t.start_time_ms, t.end_time_ms) for t in trace] == [
+        ("slow", 0.0, 1.0),
+        ("zero", 0.0, 0.0),
+        ("delay(e1->after)", 0.0, 0.0),
+        ("after", 0.0, 0.0),
+    ]
+    assert runs[0].last_ui_event_time_ms == 0.0
+    assert runs[0].critical_path_tasks == "slow"
+
+
+def test_v2_unvalidated_model_only_fails_on_names_a_run_reaches() -> None:
+    # Undeclared tasks/contexts and missing dist params in unreachable wiring
+    # must not stop the reachable part from simulating.
+    def _model(wiring: dict) -> Model:
+        return Model.from_json(
+            {
+                "schema_version": 2,
+                "entry_event": "start",
+                "contexts": {"ui": {"concurrency": 1}},
+                "events": {"start": {"tags": ["ui"]}},
+                "tasks": {
+                    "a": {"context": "ui", "duration_ms": _fixed(1.0)},
+                    "b": {"context": "nope", "duration_ms": _fixed(1.0)},
+                    "c": {"context": "ui", "duration_ms": {"dist": "fixed"}},
+                },
+                "wiring": wiring,
+            }
+        )
+
+    runs, _ = simulate_many(
+        model=_model(
+            {
+                "start": ["a"],
+                "orphan": ["missing_task", "b", "c"],
+                "later": [{"task": "missing_task", "delay_ms": 2.0}],
+            }
+        ),
+        runs=2,
+        seed=1,
+        max_tasks_per_run=10,
+        want_trace=False,
+    )
+    assert [r.makespan_ms for r in runs] == [1.0, 1.0]
+    assert [r.critical_path_tasks for r in runs] == ["a", "a"]
+
+    for wiring, missing in (
+        ({"start": ["a", "missing_task"]}, "missing_task"),
+        ({"start": [{"task": "missing_task", "delay_ms": 2.0}]}, "missing_task"),
+        ({"start": ["b"]}, "nope"),
+        ({"start": ["c"]}, "value"),
+    ):
+        with pytest.raises(KeyError, match=missing):
+            simulate_many(
+                model=_model(wiring),
+                runs=1,
+                seed=1,
+                max_tasks_per_run=10,
+                want_trace=False,
+            )